@@ -4,34 +4,48 @@ For more details about this integration, please refer to
 https://github.com/leikoilja/ha-google-home
 """
 
-from datetime import timedelta
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import cast
 
 from homeassistant.components import zeroconf
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import GlocaltokensApiClient
+from .capabilities import CapabilityStore
 from .const import (
     CONF_ANDROID_ID,
+    CONF_DEVICE_POLLING,
+    CONF_FAST_START,
+    CONF_HEDGED_REQUESTS,
     CONF_MASTER_TOKEN,
+    CONF_MAX_REQUEST_TIMEOUT,
+    CONF_MEASURE_LOAD,
+    CONF_MIN_REQUEST_TIMEOUT,
+    CONF_STAGGER_POLLING,
+    CONF_STREAM_UPDATES,
     CONF_UPDATE_INTERVAL,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DEFAULT_FAST_START,
+    DEFAULT_HEDGED_REQUESTS,
+    DEFAULT_MAX_REQUEST_TIMEOUT,
+    DEFAULT_MEASURE_LOAD,
+    DEFAULT_MIN_REQUEST_TIMEOUT,
+    DEFAULT_STAGGER_POLLING,
+    DEFAULT_STREAM_UPDATES,
     DOMAIN,
+    DOMAIN_DATA,
     PLATFORMS,
-    SENSOR,
     STARTUP_MESSAGE,
     UPDATE_INTERVAL,
 )
+from .coordinator import GoogleHomeCoordinator
+from .inventory import DeviceInventoryStore
+from .memory import async_register_profile_service
 from .types import GoogleHomeConfigEntry
 
-if TYPE_CHECKING:
-    from .models import GoogleHomeDevice
-
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
@@ -45,17 +59,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: GoogleHomeConfigEntry) -
     password = cast("str", entry.data.get(CONF_PASSWORD))
     android_id = cast("str", entry.data.get(CONF_ANDROID_ID))
     master_token = cast("str", entry.data.get(CONF_MASTER_TOKEN))
-    update_interval = cast(
-        "int", entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)
-    )
-
-    _LOGGER.debug(
-        "Coordinator update interval is: %s", timedelta(seconds=update_interval)
-    )
 
     session = async_get_clientsession(hass, verify_ssl=False)
 
-    zeroconf_instance = await zeroconf.async_get_instance(hass)
+    zeroconf_instance = await zeroconf.async_get_async_instance(hass)
     glocaltokens_client = GlocaltokensApiClient(
         hass=hass,
         session=session,
@@ -65,25 +72,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: GoogleHomeConfigEntry) -
         android_id=android_id,
         zeroconf_instance=zeroconf_instance,
     )
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=SENSOR,
-        update_method=glocaltokens_client.update_google_devices_information,
-        update_interval=timedelta(seconds=update_interval),
-        config_entry=entry,
+    # Also runs when setup fails, so retries don't leak executor threads
+    entry.async_on_unload(glocaltokens_client.shutdown)
+    _apply_client_options(glocaltokens_client, entry)
+    if flow_client := hass.data.get(DOMAIN_DATA, {}).pop(master_token, None):
+        # Tokens and devices were fetched by the config flow moments ago
+        glocaltokens_client.adopt(flow_client)
+
+    coordinator = GoogleHomeCoordinator(hass, entry, glocaltokens_client)
+    _apply_coordinator_options(coordinator, entry)
+
+    capability_store = CapabilityStore(hass, entry.entry_id)
+    await capability_store.async_load(glocaltokens_client.capabilities)
+    entry.async_on_unload(
+        glocaltokens_client.capabilities.async_add_listener(
+            lambda: capability_store.async_schedule_save(
+                glocaltokens_client.capabilities
+            )
+        )
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    inventory = DeviceInventoryStore(hass, entry.entry_id)
+    restored_devices = (
+        await inventory.async_load()
+        if entry.options.get(CONF_FAST_START, DEFAULT_FAST_START)
+        else []
+    )
+    if restored_devices:
+        # Create entities from the last known inventory right away,
+        # the first refresh is done in the background.
+        _LOGGER.debug(
+            "Restored %d devices from the last known inventory", len(restored_devices)
+        )
+        glocaltokens_client.restore_devices(restored_devices)
+        coordinator.async_set_updated_data(restored_devices)
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_CLIENT: glocaltokens_client,
         DATA_COORDINATOR: coordinator,
     }
 
+    entry.async_on_unload(
+        coordinator.async_add_listener(
+            lambda: inventory.async_schedule_save(glocaltokens_client.google_devices)
+        )
+    )
+    entry.async_on_unload(
+        async_register_profile_service(hass, coordinator, glocaltokens_client)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if restored_devices:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
+    glocaltokens_client.token_refresher.start()
+
     entry.async_on_unload(entry.add_update_listener(async_update_entry))
     return True
 
@@ -97,15 +145,45 @@ async def async_unload_entry(hass: HomeAssistant, entry: GoogleHomeConfigEntry)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: GoogleHomeConfigEntry) -> None:
+    """Remove the persisted device inventory and capabilities of a removed entry."""
+    await DeviceInventoryStore(hass, entry.entry_id).async_remove()
+    await CapabilityStore(hass, entry.entry_id).async_remove()
+
+
 async def async_update_entry(hass: HomeAssistant, entry: GoogleHomeConfigEntry) -> None:
     """Update config entry."""
-    _LOGGER.debug("Options updated, updating coordinator interval...")
-    update_interval: int = entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)
-    coordinator: DataUpdateCoordinator[list[GoogleHomeDevice]] = hass.data[DOMAIN][
-        entry.entry_id
-    ][DATA_COORDINATOR]
-    # This property has a setter
-    coordinator.update_interval = timedelta(seconds=update_interval)  # type: ignore[misc]
-    _LOGGER.debug(
-        "Coordinator update interval is: %s", timedelta(seconds=update_interval)
+    _LOGGER.debug("Options updated, updating coordinator and client...")
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    _apply_coordinator_options(entry_data[DATA_COORDINATOR], entry)
+    _apply_client_options(entry_data[DATA_CLIENT], entry)
+
+
+def _apply_coordinator_options(
+    coordinator: GoogleHomeCoordinator, entry: GoogleHomeConfigEntry
+) -> None:
+    """Apply polling interval and load measurement options to the coordinator."""
+    coordinator.set_polling(
+        entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL),
+        entry.options.get(CONF_STAGGER_POLLING, DEFAULT_STAGGER_POLLING),
+    )
+    coordinator.set_load_monitoring(
+        entry.options.get(CONF_MEASURE_LOAD, DEFAULT_MEASURE_LOAD)
+    )
+
+
+def _apply_client_options(
+    client: GlocaltokensApiClient, entry: GoogleHomeConfigEntry
+) -> None:
+    """Apply request and polling options to the client."""
+    client.latency.set_bounds(
+        entry.options.get(CONF_MIN_REQUEST_TIMEOUT, DEFAULT_MIN_REQUEST_TIMEOUT),
+        entry.options.get(CONF_MAX_REQUEST_TIMEOUT, DEFAULT_MAX_REQUEST_TIMEOUT),
+    )
+    client.hedged_requests = entry.options.get(
+        CONF_HEDGED_REQUESTS, DEFAULT_HEDGED_REQUESTS
+    )
+    client.polling.set_settings(entry.options.get(CONF_DEVICE_POLLING, {}))
+    client.stream_results = entry.options.get(
+        CONF_STREAM_UPDATES, DEFAULT_STREAM_UPDATES
     )
@@ -3,40 +3,75 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime
+from functools import partial
 from http import HTTPStatus
 import ipaddress
+import json
 import logging
+import threading
+import time
 from typing import TYPE_CHECKING, Literal, cast
 
-from aiohttp import ClientError, ClientSession, ClientTimeout
-from aiohttp.client_exceptions import ClientConnectorError, ContentTypeError
-from glocaltokens.client import Device, GLocalAuthenticationTokens
+from aiohttp import ClientError, ClientResponse, ClientSession, ClientTimeout
+from aiohttp.client_exceptions import ClientConnectorError
 from glocaltokens.utils.token import is_aas_et
 
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .capabilities import DeviceCapabilities
 from .const import (
     API_ENDPOINT_ALARM_DELETE,
     API_ENDPOINT_ALARM_VOLUME,
     API_ENDPOINT_ALARMS,
     API_ENDPOINT_DO_NOT_DISTURB,
     API_ENDPOINT_REBOOT,
+    CONTENT_TYPE_JSON,
+    DOMAIN,
     HEADER_CAST_LOCAL_AUTH,
     HEADER_CONTENT_TYPE,
     JSON_ALARM,
     JSON_ALARM_VOLUME,
     JSON_NOTIFICATIONS_ENABLED,
     JSON_TIMER,
+    MAX_HEDGED_DEVICE_REQUESTS,
+    POLL_ALARM_VOLUME,
+    POLL_ALARMS,
+    POLL_CYCLE_DEADLINE,
+    POLL_DO_NOT_DISTURB,
     PORT,
-    TIMEOUT,
+    REQUEST_RETRIES,
+)
+from .discovery import async_discover_devices
+from .events import async_fire_item_events
+from .exceptions import (
+    CloudRateLimited,
+    CloudRequestError,
+    InvalidMasterToken,
+    MalformedResponse,
 )
-from .exceptions import InvalidMasterToken
+from .executor import CloudExecutor
+from .history import DeviceHistory
+from .index import HouseIndex
+from .latency import LatencyTracker
 from .models import GoogleHomeDevice
+from .network import async_race_addresses
+from .polling import PollingSchedule, poll_offsets
+from .ratelimit import CloudRateLimiter
+from .retry import RetryThrottle, retry_delay
+from .scheduler import DeviceRequestScheduler, RequestPriority
+from .tokens import TokenRefresher
 
 if TYPE_CHECKING:
-    from zeroconf import Zeroconf
+    from collections.abc import Awaitable, Callable, Coroutine
+
+    from glocaltokens.client import Device, GLocalAuthenticationTokens
+    from zeroconf.asyncio import AsyncZeroconf
 
     from homeassistant.core import HomeAssistant
 
-    from .types import AlarmJsonDict, JsonDict, TimerJsonDict
+    from .types import DiscoveryInfo, JsonDict, TokenAgesDict, UpdateTimingsDict
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -52,7 +87,7 @@ class GlocaltokensApiClient:
         password: str | None = None,
         master_token: str | None = None,
         android_id: str | None = None,
-        zeroconf_instance: Zeroconf | None = None,
+        zeroconf_instance: AsyncZeroconf | None = None,
     ):
         """Sample API Client."""
         self.hass = hass
@@ -60,73 +95,309 @@ class GlocaltokensApiClient:
         self._password = password
         self._session = session
         self._android_id = android_id
-        verbose = _LOGGER.level == logging.DEBUG
-        self._client = GLocalAuthenticationTokens(
-            username=username,
-            password=password,
-            master_token=master_token,
-            android_id=android_id,
-            verbose=verbose,
-        )
+        self._master_token = master_token
+        # glocaltokens client is created on first cloud call,
+        # so that loading the integration doesn't import gRPC.
+        self._client: GLocalAuthenticationTokens | None = None
+        self._client_lock = threading.Lock()
+        # Calls read and replace tokens cached by the client, one at a time
+        self._call_lock = threading.Lock()
         self.google_devices: list[GoogleHomeDevice] = []
+        # Devices are kept on token errors to not lose their state,
+        # this flag requests them to be refreshed from the cloud instead.
+        self._devices_outdated = False
         self.zeroconf_instance = zeroconf_instance
+        self._inflight_requests: dict[
+            tuple[str, ...], asyncio.Task[JsonDict | None]
+        ] = {}
+        self._inflight_collections: dict[
+            tuple[str, ...], asyncio.Task[GoogleHomeDevice]
+        ] = {}
+        self._inflight_races: dict[tuple[str, ...], asyncio.Task[None]] = {}
+        # Poll cycle in which no address of a device accepted connections
+        self._poll_cycle = 0
+        self._failed_races: dict[str, int] = {}
+        self._inflight_cloud_calls: dict[tuple[str, ...], asyncio.Task[object]] = {}
+        self.scheduler = DeviceRequestScheduler()
+        self.latency = LatencyTracker()
+        self.retry_throttle = RetryThrottle()
+        self.hedged_requests = False
+        self.malformed_responses: dict[str, int] = {}
+        self.history = DeviceHistory()
+        self.polling = PollingSchedule()
+        self.capabilities = DeviceCapabilities()
+        self.last_update_timings: UpdateTimingsDict | None = None
+        # Called with devices that finished polling after the cycle deadline,
+        # or with every polled device as soon as it finishes when streaming.
+        self.device_result_callback: Callable[[GoogleHomeDevice], None] | None = None
+        self.stream_results = False
+        self.executor = CloudExecutor(hass)
+        self.cloud_limiter = CloudRateLimiter()
+        self.token_refresher = TokenRefresher(hass, self)
+        self.item_index = HouseIndex()
+
+    def _get_client(self) -> GLocalAuthenticationTokens:
+        """Return glocaltokens client, creating it if needed.
+
+        Must be called from the executor, glocaltokens imports gRPC and protobuf.
+        """
+        with self._client_lock:
+            if self._client is None:
+                # pylint: disable-next=import-outside-toplevel
+                from glocaltokens.client import GLocalAuthenticationTokens  # noqa: PLC0415
+
+                self._client = GLocalAuthenticationTokens(
+                    username=self._username,
+                    password=self._password,
+                    master_token=self._master_token,
+                    android_id=self._android_id,
+                    verbose=_LOGGER.level == logging.DEBUG,
+                )
+            return self._client
+
+    async def _async_call_cloud[T](
+        self,
+        name: str,
+        func: Callable[[GLocalAuthenticationTokens], T],
+        *,
+        rate_limited: bool = True,
+    ) -> T:
+        """Call glocaltokens client in the executor.
+
+        Concurrent calls of the same name share a single request, which has to
+        pass the cloud rate limiter unless it doesn't leave the host.
+        """
+        if not rate_limited:
+            return await self.executor.async_run(name, partial(self._call_cloud, func))
+        # Calls of different names return different types, a name always the same
+        result = await self._single_flight(
+            self._inflight_cloud_calls,
+            ("cloud", name),
+            partial(self._async_call_cloud_limited, name, func),
+        )
+        return cast("T", result)
+
+    async def _async_call_cloud_limited[T](
+        self, name: str, func: Callable[[GLocalAuthenticationTokens], T]
+    ) -> T:
+        """Call glocaltokens client if the rate limiter allows it."""
+        self.cloud_limiter.acquire(name)
+        try:
+            result = await self.executor.async_run(
+                name, partial(self._call_cloud, func)
+            )
+        except CloudRequestError:
+            self.cloud_limiter.record_failure()
+            raise
+        self.cloud_limiter.record_success()
+        return result
+
+    def _call_cloud[T](self, func: Callable[[GLocalAuthenticationTokens], T]) -> T:
+        """Call glocaltokens client. Must be called from the executor."""
+        # pylint: disable-next=import-outside-toplevel
+        from requests.exceptions import RequestException  # noqa: PLC0415
+
+        client = self._get_client()
+        try:
+            with self._call_lock:
+                return func(client)
+        except RequestException as err:
+            raise CloudRequestError from err
 
     async def async_get_master_token(self) -> str:
         """Get master API token."""
 
-        def _get_master_token() -> str | None:
-            return self._client.get_master_token()
-
-        master_token = await self.hass.async_add_executor_job(_get_master_token)
+        master_token = await self._async_call_cloud(
+            "get_master_token", lambda client: client.get_master_token()
+        )
         if master_token is None or is_aas_et(master_token) is False:
+            self.cloud_limiter.record_failure()
             raise InvalidMasterToken
         return master_token
 
     async def async_get_access_token(self) -> str:
         """Get access token using master token."""
 
-        def _get_access_token() -> str | None:
-            return self._client.get_access_token()
-
-        access_token = await self.hass.async_add_executor_job(_get_access_token)
+        access_token = await self._async_call_cloud(
+            "get_access_token", lambda client: client.get_access_token()
+        )
         if access_token is None:
+            self.cloud_limiter.record_failure()
             raise InvalidMasterToken
         return access_token
 
-    async def get_google_devices(self) -> list[GoogleHomeDevice]:
+    async def async_refresh_access_token(self) -> None:
+        """Get a new access token before the cached one expires."""
+
+        def _refresh_access_token(client: GLocalAuthenticationTokens) -> str | None:
+            access_token = client.access_token
+            access_token_date = client.access_token_date
+            client.invalidate_access_token()
+            new_access_token = client.get_access_token()
+            if new_access_token is None:
+                # Keep the old token, it is still valid for a while
+                client.access_token = access_token
+                client.access_token_date = access_token_date
+            return new_access_token
+
+        access_token = await self._async_call_cloud(
+            "refresh_access_token", _refresh_access_token
+        )
+        if access_token is None:
+            self.cloud_limiter.record_failure()
+            raise InvalidMasterToken
+
+    async def get_google_devices(
+        self, force_refresh: bool = False
+    ) -> list[GoogleHomeDevice]:
         """Get google device authentication tokens.
 
         Note this method will fetch necessary access tokens if missing.
+        Devices are only fetched from the cloud when they are unknown or
+        outdated, unless a refresh is forced.
         """
 
-        if not self.google_devices:
+        if not self.google_devices or self._devices_outdated or force_refresh:
 
-            def _get_google_devices() -> list[Device]:
-                return self._client.get_google_devices(
-                    zeroconf_instance=self.zeroconf_instance,
+            def _get_google_devices(
+                client: GLocalAuthenticationTokens,
+            ) -> tuple[list[Device], dict[str, str]]:
+                # Discovery is done natively by us, glocaltokens only
+                # fetches the homegraph.
+                devices = client.get_google_devices(
+                    disable_discovery=True,
                     force_homegraph_reload=True,
                 )
+                homegraph = client.homegraph
+                unique_ids = (
+                    {
+                        item.device_info.device_id: item.device_info.agent_info.unique_id
+                        for item in homegraph.home.devices
+                    }
+                    if homegraph is not None
+                    else {}
+                )
+                return devices, unique_ids
 
-            google_devices = await self.hass.async_add_executor_job(_get_google_devices)
-            self.google_devices = [
-                GoogleHomeDevice(
-                    device_id=device.device_id,
-                    name=device.device_name,
-                    auth_token=device.local_auth_token,
-                    ip_address=device.ip_address,
-                    hardware=device.hardware,
+            try:
+                (google_devices, unique_ids), discovered = await asyncio.gather(
+                    self._async_call_cloud("get_google_devices", _get_google_devices),
+                    self._async_discover_devices(),
                 )
-                for device in google_devices
-            ]
+            except CloudRateLimited:
+                # Keep polling with the tokens we have, refresh them later
+                return self.google_devices
+
+            if not google_devices:
+                _LOGGER.debug("No devices received from the cloud, will retry later")
+                self.cloud_limiter.record_failure()
+                return self.google_devices
+
+            # Update known devices in place so that their state is preserved
+            known_devices = {device.device_id: device for device in self.google_devices}
+            self.google_devices = []
+            for device in google_devices:
+                network_device = discovered.get(unique_ids.get(device.device_id, ""))
+                name = network_device["name"] if network_device else device.device_name
+                addresses = network_device["addresses"] if network_device else []
+                google_device = known_devices.get(device.device_id)
+                if google_device is None:
+                    google_device = GoogleHomeDevice(
+                        device_id=device.device_id,
+                        name=name,
+                        auth_token=device.local_auth_token,
+                        hardware=device.hardware,
+                    )
+                    google_device.set_auth_token(device.local_auth_token)
+                    google_device.set_ip_addresses(addresses)
+                else:
+                    google_device.name = name
+                    google_device.set_auth_token(device.local_auth_token)
+                    ip_address = google_device.ip_address
+                    google_device.set_ip_addresses(addresses)
+                    if google_device.ip_address != ip_address:
+                        self.latency.forget(device.device_id)
+                    google_device.hardware = device.hardware
+                    google_device.restored = False
+                self.google_devices.append(google_device)
+            for device_id in known_devices.keys() - {
+                device.device_id for device in self.google_devices
+            }:
+                # Device was removed from the account
+                self.latency.forget(device_id)
+                self.history.forget(device_id)
+                self._failed_races.pop(device_id, None)
+            self._devices_outdated = False
         return self.google_devices
 
+    async def _async_discover_devices(self) -> dict[str, DiscoveryInfo]:
+        """Discover devices on the local network if zeroconf is available."""
+        if self.zeroconf_instance is None:
+            return {}
+        return await async_discover_devices(self.zeroconf_instance)
+
     async def get_android_id(self) -> str:
         """Generate random android_id."""
 
-        def _get_android_id() -> str:
-            return self._client.get_android_id()
+        # Android ID is generated locally, no need to limit it
+        return await self._async_call_cloud(
+            "get_android_id", lambda client: client.get_android_id(), rate_limited=False
+        )
+
+    def adopt(self, other: GlocaltokensApiClient) -> None:
+        """Take over tokens and devices fetched by another client.
+
+        Lets the first setup reuse what the config flow got from the cloud.
+        """
+        self._client = other.glocaltokens
+        self.google_devices = other.google_devices
+
+    def restore_devices(self, devices: list[GoogleHomeDevice]) -> None:
+        """Use devices of the last known inventory until the cloud is reached.
+
+        Their auth tokens are not persisted, so they are fetched on the next
+        update before the devices can be polled.
+        """
+        self.google_devices = devices
+        self._devices_outdated = True
+
+    @property
+    def glocaltokens(self) -> GLocalAuthenticationTokens | None:
+        """Return glocaltokens client holding the tokens, if created yet."""
+        return self._client
+
+    def token_ages(self) -> TokenAgesDict:
+        """Return age in seconds of the cached tokens and homegraph.
+
+        Local auth token is the oldest one received from the cloud.
+        """
+        now = datetime.now()
+        client = self._client
+        access_token_date = client.access_token_date if client else None
+        homegraph_date = client.homegraph_date if client else None
+        auth_tokens_received = [
+            device.auth_token_received
+            for device in self.google_devices
+            if device.auth_token and device.auth_token_received is not None
+        ]
+        return {
+            "access_token": (
+                (now - access_token_date).total_seconds() if access_token_date else None
+            ),
+            "homegraph": (
+                (now - homegraph_date).total_seconds() if homegraph_date else None
+            ),
+            "local_auth_token": (
+                time.monotonic() - min(auth_tokens_received)
+                if auth_tokens_received
+                else None
+            ),
+        }
 
-        return await self.hass.async_add_executor_job(_get_android_id)
+    def shutdown(self) -> None:
+        """Release resources held by the client."""
+        self.token_refresher.stop()
+        self.executor.shutdown()
 
     @staticmethod
     def create_url(ip_address: str, port: int, api_endpoint: str) -> str:
@@ -138,10 +409,43 @@ class GlocaltokensApiClient:
             ip_address = f"[{ip_address}]"
         return f"https://{ip_address}:{port}/{api_endpoint}"
 
-    async def update_google_devices_information(self) -> list[GoogleHomeDevice]:
-        """Retrieve devices from glocaltokens and fetches alarm/timer data from each of the device."""
+    async def _single_flight[T](
+        self,
+        inflight: dict[tuple[str, ...], asyncio.Task[T]],
+        key: tuple[str, ...],
+        factory: Callable[[], Coroutine[object, object, T]],
+    ) -> T:
+        """Run factory once and share its result with concurrent callers of the same key."""
+        task = inflight.get(key)
+        if task is None:
+            task = self.hass.async_create_task(factory(), f"{DOMAIN} {' '.join(key)}")
+            inflight[key] = task
+
+            def _forget(finished: asyncio.Task[T]) -> None:
+                if inflight.get(key) is finished:
+                    del inflight[key]
+
+            task.add_done_callback(_forget)
+        else:
+            _LOGGER.debug("Joining in-flight request %s", key)
+        # Shield so that a cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    async def update_google_devices_information(
+        self, stagger_window: float = 0.0
+    ) -> list[GoogleHomeDevice]:
+        """Retrieve devices from glocaltokens and fetches alarm/timer data from each of the device.
+
+        With a stagger window the polls of the devices are spread over that
+        many seconds instead of starting all at once, and every device is
+        published as soon as its poll finishes.
+        """
 
+        started = time.monotonic()
+        self._poll_cycle += 1
         devices = await self.get_google_devices()
+        devices_fetched = time.monotonic()
+        self.item_index.sync(devices)
 
         # Gives the user a warning if the device is offline
         for device in devices:
@@ -157,21 +461,122 @@ class GlocaltokensApiClient:
                     device.name,
                 )
 
-        return await asyncio.gather(
-            *[
-                self.collect_data_from_endpoints(device)
-                for device in devices
-                if device.ip_address and device.auth_token
-            ]
+        polled_devices = [
+            device
+            for device in devices
+            if device.ip_address
+            and device.auth_token
+            and not self.polling.is_excluded(device.device_id)
+        ]
+        offsets = (
+            poll_offsets(
+                [device.device_id for device in polled_devices], stagger_window
+            )
+            if stagger_window
+            else {}
         )
+        # Devices polled early in a window would otherwise wait for its end
+        stream = self.stream_results or bool(stagger_window)
+        tasks = {
+            self.hass.async_create_task(
+                self._collect_data_later(
+                    device, offsets.get(device.device_id, 0.0), stream=stream
+                ),
+                f"{DOMAIN} collect {device.device_id}",
+            ): device
+            for device in polled_devices
+        }
+        pending: set[asyncio.Task[GoogleHomeDevice]] = set()
+        if tasks:
+            try:
+                _, pending = await asyncio.wait(
+                    tasks, timeout=stagger_window + POLL_CYCLE_DEADLINE
+                )
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
+        for task in pending:
+            # Publish the others now, this device keeps its last known data
+            device = tasks[task]
+            device.stale = True
+            task.add_done_callback(partial(self._handle_late_result, device))
+            _LOGGER.debug(
+                "Polling %s didn't finish in time, its data will be updated later",
+                device.name,
+            )
+        for task in tasks.keys() - pending:
+            # Raise errors of finished polls like gather would
+            task.result()
+        finished = time.monotonic()
+        self.last_update_timings = {
+            "time": dt_util.utcnow().isoformat(),
+            "get_devices": round(devices_fetched - started, 3),
+            "collect_data": round(finished - devices_fetched, 3),
+            "total": round(finished - started, 3),
+            "stale": len(pending),
+        }
+        return polled_devices
+
+    @staticmethod
+    def _handle_late_result(
+        device: GoogleHomeDevice, task: asyncio.Task[GoogleHomeDevice]
+    ) -> None:
+        """Log outcome of a poll that finished after the deadline.
+
+        Its data was already published by _collect_data_later.
+        """
+        if task.cancelled():
+            return
+        if (err := task.exception()) is not None:
+            _LOGGER.debug("Polling %s failed after the deadline: %r", device.name, err)
+            return
+        _LOGGER.debug("Polling %s finished after the deadline", device.name)
+
+    async def _collect_data_later(
+        self, device: GoogleHomeDevice, delay: float, *, stream: bool
+    ) -> GoogleHomeDevice:
+        """Collect data of the device after a delay."""
+        if delay:
+            await asyncio.sleep(delay)
+        await self._single_flight(
+            self._inflight_collections,
+            (device.device_id,),
+            partial(self.collect_data_from_endpoints, device),
+        )
+        late = device.stale
+        device.stale = False
+        if (late or stream) and self.device_result_callback is not None:
+            self.device_result_callback(device)
+        return device
 
     async def collect_data_from_endpoints(
         self, device: GoogleHomeDevice
     ) -> GoogleHomeDevice:
         """Collect data from different endpoints."""
-        device = await self.update_alarms_and_timers(device)
-        device = await self.update_alarm_volume(device)
-        return await self.update_do_not_disturb(device)
+        started = time.monotonic()
+        alarms_delta, timers_delta = device.alarms_delta, device.timers_delta
+        for endpoint, api_endpoint, update in (
+            (POLL_ALARMS, API_ENDPOINT_ALARMS, self.update_alarms_and_timers),
+            (POLL_ALARM_VOLUME, API_ENDPOINT_ALARM_VOLUME, self.update_alarm_volume),
+            (
+                POLL_DO_NOT_DISTURB,
+                API_ENDPOINT_DO_NOT_DISTURB,
+                self.update_do_not_disturb,
+            ),
+        ):
+            if self.polling.is_due(
+                device.device_id, endpoint
+            ) and self.capabilities.is_supported(device, api_endpoint):
+                self.polling.mark_polled(device.device_id, endpoint)
+                device = await update(device)
+        self.history.record(
+            device,
+            time.monotonic() - started,
+            alarms_updated=device.alarms_delta is not alarms_delta,
+            timers_updated=device.timers_delta is not timers_delta,
+        )
+        return device
 
     async def update_alarms_and_timers(
         self, device: GoogleHomeDevice
@@ -182,26 +587,37 @@ class GlocaltokensApiClient:
         )
 
         if response is not None:
-            if JSON_TIMER in response and JSON_ALARM in response:
-                device.set_timers(cast("list[TimerJsonDict]", response[JSON_TIMER]))
-                device.set_alarms(cast("list[AlarmJsonDict]", response[JSON_ALARM]))
-                _LOGGER.debug(
-                    "Successfully retrieved alarms and timers from %s. Response: %s",
-                    device.name,
-                    response,
+            try:
+                device.set_alarms_and_timers(
+                    response.get(JSON_ALARM), response.get(JSON_TIMER)
                 )
+            except MalformedResponse as err:
+                self._count_malformed_response(device, API_ENDPOINT_ALARMS, err)
             else:
-                _LOGGER.error(
-                    (
-                        "Failed to parse fetched alarms and timers for device %s - "
-                        "API returned unknown json structure. "
-                        "Received = %s"
-                    ),
+                async_fire_item_events(self.hass, device)
+                self.item_index.apply(device)
+                _LOGGER.debug(
+                    "Successfully retrieved %d alarms and %d timers from %s",
+                    len(device.get_alarm_ids()),
+                    len(device.get_timer_ids()),
                     device.name,
-                    response,
                 )
         return device
 
+    def _count_malformed_response(
+        self, device: GoogleHomeDevice, endpoint: str, error: Exception | str
+    ) -> None:
+        """Count response that couldn't be parsed, without logging it in full."""
+        count = self.malformed_responses.get(device.device_id, 0) + 1
+        self.malformed_responses[device.device_id] = count
+        _LOGGER.debug(
+            "Malformed response from %s to %s (%d so far): %s",
+            device.name,
+            endpoint,
+            count,
+            error,
+        )
+
     async def delete_alarm_or_timer(
         self, device: GoogleHomeDevice, item_to_delete: str
     ) -> None:
@@ -316,13 +732,10 @@ class GlocaltokensApiClient:
 
                 device.set_do_not_disturb(enabled)
             else:
-                _LOGGER.debug(
-                    (
-                        "Unexpected response from Google Home device '%s' "
-                        "when fetching DND status - %s"
-                    ),
-                    device.name,
-                    response,
+                self._count_malformed_response(
+                    device,
+                    API_ENDPOINT_DO_NOT_DISTURB,
+                    f"missing {JSON_NOTIFICATIONS_ENABLED}",
                 )
 
         return device
@@ -380,17 +793,26 @@ class GlocaltokensApiClient:
                     )
                 device.set_alarm_volume(volume)
             else:
-                _LOGGER.debug(
-                    (
-                        "Unexpected response from Google Home device '%s' "
-                        "when fetching alarm volume setting - %s"
-                    ),
-                    device.name,
-                    response,
+                self._count_malformed_response(
+                    device, API_ENDPOINT_ALARM_VOLUME, f"missing {JSON_ALARM_VOLUME}"
                 )
 
         return device
 
+    def _decode_response(
+        self, device: GoogleHomeDevice, endpoint: str, body: bytes
+    ) -> JsonDict:
+        """Decode JSON response body."""
+        try:
+            decoded = json_loads(body)
+        except JSON_DECODE_EXCEPTIONS as err:
+            self._count_malformed_response(device, endpoint, err)
+            return {}
+        if not isinstance(decoded, dict):
+            self._count_malformed_response(device, endpoint, "not a JSON object")
+            return {}
+        return decoded
+
     async def request(
         self,
         method: Literal["GET", "POST"],
@@ -399,7 +821,46 @@ class GlocaltokensApiClient:
         data: JsonDict | None = None,
         polling: bool = False,
     ) -> JsonDict | None:
-        """Shared request method."""
+        """Shared request method.
+
+        Polling requests are read-only, so concurrent identical ones
+        (scheduled poll, refresh service, refresh after deleting an alarm)
+        share a single in-flight request to the device. Reads started before
+        a write are not shared after it, they may miss what it changed.
+        """
+        if not polling:
+            try:
+                return await self._request(method, endpoint, device, data, polling)
+            finally:
+                self._detach_inflight_reads(device.device_id)
+
+        key = (
+            device.device_id,
+            method,
+            endpoint,
+            json.dumps(data, sort_keys=True),
+        )
+        return await self._single_flight(
+            self._inflight_requests,
+            key,
+            partial(self._request, method, endpoint, device, data, polling),
+        )
+
+    def _detach_inflight_reads(self, device_id: str) -> None:
+        """Let the next reads of the device start fresh instead of joining."""
+        for inflight in (self._inflight_requests, self._inflight_collections):
+            for key in [key for key in inflight if key[0] == device_id]:
+                del inflight[key]
+
+    async def _request(
+        self,
+        method: Literal["GET", "POST"],
+        endpoint: str,
+        device: GoogleHomeDevice,
+        data: JsonDict | None,
+        polling: bool,
+    ) -> JsonDict | None:
+        """Perform the request to the device."""
 
         if device.ip_address is None:
             _LOGGER.warning("Device %s doesn't have an IP address!", device.name)
@@ -409,11 +870,23 @@ class GlocaltokensApiClient:
             _LOGGER.warning("Device %s doesn't have an auth token!", device.name)
             return None
 
+        if (
+            not device.address_verified
+            and len(device.ip_addresses) > 1
+            # A device that is off fails every race, race once per cycle
+            and self._failed_races.get(device.device_id) != self._poll_cycle
+        ):
+            await self._single_flight(
+                self._inflight_races,
+                (device.device_id,),
+                partial(self._async_race_addresses, device),
+            )
+
         url = self.create_url(device.ip_address, PORT, endpoint)
 
         headers: dict[str, str] = {
             HEADER_CAST_LOCAL_AUTH: device.auth_token,
-            HEADER_CONTENT_TYPE: "application/json",
+            HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON,
         }
 
         _LOGGER.debug(
@@ -424,18 +897,31 @@ class GlocaltokensApiClient:
         )
 
         resp = None
+        priority = (
+            RequestPriority.BACKGROUND if polling else RequestPriority.INTERACTIVE
+        )
 
+        fetch = partial(
+            self._fetch, method, url, endpoint, device, data=data, headers=headers
+        )
         try:
-            timeout = ClientTimeout(total=TIMEOUT)
-            async with self._session.request(
-                method, url, json=data, headers=headers, timeout=timeout
-            ) as response:
+            async with self.scheduler.slot(device.device_id, priority):
+                if polling:
+                    response, body = await self._fetch_with_retries(
+                        device, endpoint, fetch
+                    )
+                else:
+                    response, body = await fetch()
+                device.address_verified = True
                 if response.status == HTTPStatus.OK:
-                    try:
-                        resp = await response.json()
-                    except ContentTypeError:
+                    if response.content_type == CONTENT_TYPE_JSON:
+                        resp = self._decode_response(device, endpoint, body)
+                    else:
                         resp = {}
                     device.available = True
+                    device.restored = False
+                    if polling:
+                        self.capabilities.record(device, endpoint, supported=True)
                 elif response.status == HTTPStatus.UNAUTHORIZED:
                     # If token is invalid - force reload homegraph providing new token
                     # and rerun the task.
@@ -453,8 +939,8 @@ class GlocaltokensApiClient:
                             "Token will be refreshed, please try again later.",
                             device.name,
                         )
-                    # We need to retry the update task instead of just cleaning the list
-                    self.google_devices = []
+                    # We need to retry the update task with devices refreshed
+                    self._devices_outdated = True
                     device.available = False
                 elif response.status == HTTPStatus.NOT_FOUND:
                     _LOGGER.debug(
@@ -469,6 +955,8 @@ class GlocaltokensApiClient:
                         device.hardware,
                     )
                     device.available = False
+                    if polling:
+                        self.capabilities.record(device, endpoint, supported=False)
                 else:
                     _LOGGER.error(
                         "Failed to access %s, API returned %d: %s",
@@ -483,6 +971,10 @@ class GlocaltokensApiClient:
                 "Failed to connect to %s device. The device is probably offline.",
                 device.name,
             )
+            device.address_verified = False
+            if device.restored:
+                # Address from the last known inventory might have changed
+                self._devices_outdated = True
             device.available = False
         except ClientError:
             # Make sure that we log the exception from the client if one occurred.
@@ -497,6 +989,154 @@ class GlocaltokensApiClient:
                 device.name,
                 data,
             )
+            device.address_verified = False
+            if device.restored:
+                self._devices_outdated = True
             device.available = False
 
         return resp
+
+    async def _async_race_addresses(self, device: GoogleHomeDevice) -> None:
+        """Switch the device to the address that accepts connections first."""
+        address = await async_race_addresses(
+            device.ip_addresses, PORT, first=device.ip_address
+        )
+        if address is None:
+            _LOGGER.debug("No address of %s accepts connections", device.name)
+            self._failed_races[device.device_id] = self._poll_cycle
+            return
+        self._failed_races.pop(device.device_id, None)
+        if address != device.ip_address:
+            _LOGGER.debug(
+                "Using address %s of %s instead of %s",
+                address,
+                device.name,
+                device.ip_address,
+            )
+            device.ip_address = address
+        device.address_verified = True
+
+    async def _fetch(
+        self,
+        method: Literal["GET", "POST"],
+        url: str,
+        endpoint: str,
+        device: GoogleHomeDevice,
+        *,
+        data: JsonDict | None,
+        headers: dict[str, str],
+    ) -> tuple[ClientResponse, bytes]:
+        """Send a single request to the device and read the response body."""
+        timeout = self.latency.timeout(device.device_id, endpoint)
+        started = time.monotonic()
+        try:
+            async with self._session.request(
+                method,
+                url,
+                json=data,
+                headers=headers,
+                timeout=ClientTimeout(total=timeout),
+            ) as response:
+                body = await response.read()
+        except TimeoutError:
+            self.latency.record_timeout(device.device_id, endpoint)
+            raise
+        self.latency.record_success(
+            device.device_id, endpoint, time.monotonic() - started
+        )
+        return response, body
+
+    async def _fetch_with_retries(
+        self,
+        device: GoogleHomeDevice,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[tuple[ClientResponse, bytes]]],
+    ) -> tuple[ClientResponse, bytes]:
+        """Fetch polled data, retrying timeouts and errors with jittered backoff.
+
+        All attempts together have to fit into the maximum request timeout,
+        so a poll of a flaky device takes about as long as a single slow one.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                if self.hedged_requests:
+                    result = await self._fetch_hedged(device, endpoint, fetch)
+                else:
+                    result = await fetch()
+            except (ClientError, TimeoutError) as err:
+                self.retry_throttle.record_failure(device.device_id)
+                delay = retry_delay(attempt)
+                finish = (
+                    time.monotonic()
+                    - started
+                    + delay
+                    + self.latency.timeout(device.device_id, endpoint)
+                )
+                if (
+                    attempt >= REQUEST_RETRIES
+                    or finish > self.latency.max_timeout
+                    or not self.retry_throttle.allow_retry(device.device_id)
+                ):
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "Retrying request to %s of %s in %.2fs (attempt %d): %r",
+                    endpoint,
+                    device.name,
+                    delay,
+                    attempt,
+                    err,
+                )
+                await asyncio.sleep(delay)
+            else:
+                self.retry_throttle.record_success(device.device_id)
+                return result
+
+    async def _fetch_hedged(
+        self,
+        device: GoogleHomeDevice,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[tuple[ClientResponse, bytes]]],
+    ) -> tuple[ClientResponse, bytes]:
+        """Send a second request if the first one is slower than usual.
+
+        The first successful response wins and the other request is cancelled.
+        The second request needs a free slot of the device, so it never takes
+        the one kept for user initiated commands.
+        """
+        tasks = {asyncio.ensure_future(fetch())}
+        try:
+            hedge_after = self.latency.percentile_95(device.device_id, endpoint)
+            if hedge_after is not None and self.retry_throttle.allow_retry(
+                device.device_id
+            ):
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done and self.scheduler.try_acquire(
+                    device.device_id, MAX_HEDGED_DEVICE_REQUESTS
+                ):
+                    _LOGGER.debug(
+                        "Request to %s of %s is slower than %.2fs, sending another",
+                        endpoint,
+                        device.name,
+                        hedge_after,
+                    )
+                    hedge = asyncio.ensure_future(fetch())
+                    hedge.add_done_callback(
+                        lambda _: self.scheduler.release(device.device_id)
+                    )
+                    tasks.add(hedge)
+            error: BaseException | None = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if (error := task.exception()) is None:
+                        return task.result()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
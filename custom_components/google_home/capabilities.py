@@ -0,0 +1,125 @@
+"""Endpoints supported by Google Home devices, learned from their responses."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CAPABILITIES_SAVE_DELAY,
+    CAPABILITIES_STORAGE_VERSION,
+    CAPABILITY_RECHECK_INTERVAL,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .models import GoogleHomeDevice
+    from .types import CapabilitiesDict, CapabilityDict
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class DeviceCapabilities:
+    """Table of endpoints supported by every device and hardware model.
+
+    Devices like Chromecasts or TVs answer 404 to alarm endpoints. Once that
+    is known, the endpoint isn't polled again until the answer is older than
+    the recheck interval. What is known about a device takes precedence over
+    what is known about its hardware model, which covers new devices.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._models: dict[str, dict[str, CapabilityDict]] = {}
+        self._devices: dict[str, dict[str, CapabilityDict]] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def load(self, data: CapabilitiesDict) -> None:
+        """Replace the table with persisted data."""
+        self._models = data["models"]
+        self._devices = data["devices"]
+
+    def as_dict(self) -> CapabilitiesDict:
+        """Return representation of the table to be persisted."""
+        return {"models": self._models, "devices": self._devices}
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for changes of the table."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @staticmethod
+    def _get_fresh(
+        table: dict[str, dict[str, CapabilityDict]], key: str | None, endpoint: str
+    ) -> CapabilityDict | None:
+        """Return capability if it was checked recently."""
+        capability = table.get(key, {}).get(endpoint) if key else None
+        if (
+            capability is None
+            or time.time() - capability["checked"] > CAPABILITY_RECHECK_INTERVAL
+        ):
+            return None
+        return capability
+
+    def is_supported(self, device: GoogleHomeDevice, endpoint: str) -> bool:
+        """Return whether the endpoint should be requested from the device."""
+        capability = self._get_fresh(
+            self._devices, device.device_id, endpoint
+        ) or self._get_fresh(self._models, device.hardware, endpoint)
+        return capability is None or capability["supported"]
+
+    def record(self, device: GoogleHomeDevice, endpoint: str, supported: bool) -> None:
+        """Remember whether the device supports the endpoint."""
+        known = self._get_fresh(self._devices, device.device_id, endpoint)
+        if known is not None and known["supported"] == supported:
+            return
+        if not supported:
+            _LOGGER.debug(
+                "Device %s (hardware='%s') doesn't support %s, "
+                "it won't be requested for a while",
+                device.name,
+                device.hardware,
+                endpoint,
+            )
+        capability: CapabilityDict = {"supported": supported, "checked": time.time()}
+        self._devices.setdefault(device.device_id, {})[endpoint] = capability
+        if device.hardware:
+            self._models.setdefault(device.hardware, {})[endpoint] = capability
+        for update_callback in self._listeners:
+            update_callback()
+
+
+class CapabilityStore:
+    """Persist learned capabilities, so they survive restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store = Store["CapabilitiesDict"](
+            hass, CAPABILITIES_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities"
+        )
+
+    async def async_load(self, capabilities: DeviceCapabilities) -> None:
+        """Load stored capabilities into the table."""
+        data = await self._store.async_load()
+        if data:
+            capabilities.load(data)
+
+    @callback
+    def async_schedule_save(self, capabilities: DeviceCapabilities) -> None:
+        """Save capabilities after a delay."""
+        self._store.async_delay_save(capabilities.as_dict, CAPABILITIES_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the stored capabilities."""
+        await self._store.async_remove()
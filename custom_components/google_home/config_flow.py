@@ -2,32 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Self
 
-from requests.exceptions import RequestException
 import voluptuous as vol
 
+from homeassistant.components import zeroconf
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .api import GlocaltokensApiClient
 from .const import (
     CONF_ANDROID_ID,
+    CONF_DEVICE,
+    CONF_DEVICE_POLLING,
+    CONF_FAST_START,
+    CONF_HEDGED_REQUESTS,
+    CONF_ITEM_ENTITIES,
     CONF_MASTER_TOKEN,
+    CONF_MAX_ATTRIBUTE_ITEMS,
+    CONF_MAX_REQUEST_TIMEOUT,
+    CONF_MEASURE_LOAD,
+    CONF_MIN_REQUEST_TIMEOUT,
     CONF_PASSWORD,
+    CONF_STAGGER_POLLING,
+    CONF_STREAM_UPDATES,
     CONF_UPDATE_INTERVAL,
     CONF_USERNAME,
+    DATA_CLIENT,
+    DEFAULT_FAST_START,
+    DEFAULT_HEDGED_REQUESTS,
+    DEFAULT_ITEM_ENTITIES,
+    DEFAULT_MAX_ATTRIBUTE_ITEMS,
+    DEFAULT_MAX_REQUEST_TIMEOUT,
+    DEFAULT_MEASURE_LOAD,
+    DEFAULT_MIN_REQUEST_TIMEOUT,
+    DEFAULT_STAGGER_POLLING,
+    DEFAULT_STREAM_UPDATES,
     DOMAIN,
+    DOMAIN_DATA,
+    FLOW_HANDOFF_TIMEOUT,
     MANUFACTURER,
     MAX_PASSWORD_LENGTH,
+    POLL_ENDPOINTS,
     UPDATE_INTERVAL,
 )
-from .exceptions import InvalidMasterToken
+from .exceptions import CloudRequestError, InvalidMasterToken
 
 if TYPE_CHECKING:
-    from .types import ConfigFlowDict, GoogleHomeConfigEntry, OptionsFlowDict
+    from datetime import datetime
+
+    from .models import GoogleHomeDevice
+    from .types import (
+        ConfigFlowDict,
+        DevicePollingDict,
+        GoogleHomeConfigEntry,
+        OptionsFlowDict,
+    )
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -59,6 +99,7 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             session = async_create_clientsession(self.hass)
+            zeroconf_instance = await zeroconf.async_get_async_instance(self.hass)
             username = user_input.get(CONF_USERNAME, "")
             self.username = username
             password = user_input.get(CONF_PASSWORD, "")
@@ -75,6 +116,7 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
                         username="",
                         password="",
                         master_token=master_token,
+                        zeroconf_instance=zeroconf_instance,
                     )
                     access_token = await self._get_access_token(client)
                     if access_token:
@@ -88,6 +130,7 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
                         session=session,
                         username=username,
                         password=password,
+                        zeroconf_instance=zeroconf_instance,
                     )
                     master_token = await self._get_master_token(client)
                     if not master_token:
@@ -100,8 +143,14 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
                     config_data[CONF_MASTER_TOKEN] = master_token
                     config_data[CONF_USERNAME] = username
                     config_data[CONF_PASSWORD] = password
-                    config_data[CONF_ANDROID_ID] = await client.get_android_id()
+                    config_data[CONF_ANDROID_ID], _ = await asyncio.gather(
+                        client.get_android_id(), self._get_devices(client)
+                    )
+                    client.shutdown()
+                    self._hand_over(master_token, client)
                     return self.async_create_entry(title=title, data=config_data)
+                if client:
+                    client.shutdown()
             else:
                 self._errors["base"] = "missing-inputs"
         return await self._show_config_form()
@@ -128,13 +177,36 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
             errors=self._errors,
         )
 
+    def _hand_over(self, master_token: str, client: GlocaltokensApiClient) -> None:
+        """Hand tokens and devices over to the setup of the entry.
+
+        They are dropped if the entry isn't set up shortly.
+        """
+        clients = self.hass.data.setdefault(DOMAIN_DATA, {})
+        clients[master_token] = client
+
+        @callback
+        def _discard(_now: datetime) -> None:
+            if clients.get(master_token) is client:
+                del clients[master_token]
+
+        async_call_later(self.hass, FLOW_HANDOFF_TIMEOUT, _discard)
+
+    @staticmethod
+    async def _get_devices(client: GlocaltokensApiClient) -> None:
+        """Fetch devices, so that the setup of the entry doesn't have to."""
+        try:
+            await client.get_google_devices()
+        except CloudRequestError:
+            _LOGGER.debug("Failed to get devices, they will be fetched on setup")
+
     @staticmethod
     async def _get_master_token(client: GlocaltokensApiClient) -> str:
         """Return master token if credentials are valid."""
         master_token = ""
         try:
             master_token = await client.async_get_master_token()
-        except (InvalidMasterToken, RequestException):
+        except (InvalidMasterToken, CloudRequestError):
             _LOGGER.exception("Failed to get master token")
         return master_token
 
@@ -144,7 +216,7 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
         access_token = ""
         try:
             access_token = await client.async_get_access_token()
-        except (InvalidMasterToken, RequestException):
+        except (InvalidMasterToken, CloudRequestError):
             _LOGGER.exception("Failed to get access token")
         return access_token
 
@@ -152,12 +224,46 @@ class GoogleHomeFlowHandler(ConfigFlow, domain=DOMAIN):
 class GoogleHomeOptionsFlowHandler(OptionsFlow):
     """Config flow options handler for GoogleHome."""
 
+    def __init__(self) -> None:
+        """Initialize."""
+        self._options: OptionsFlowDict
+        self._device_id = ""
+        self._device_names: dict[str, str] = {}
+
     async def async_step_init(
         self, user_input: OptionsFlowDict | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(data=user_input)
+            if user_input.get(
+                CONF_MIN_REQUEST_TIMEOUT, DEFAULT_MIN_REQUEST_TIMEOUT
+            ) > user_input.get(CONF_MAX_REQUEST_TIMEOUT, DEFAULT_MAX_REQUEST_TIMEOUT):
+                errors["base"] = "request-timeout-bounds"
+            else:
+                self._options = user_input.copy()
+                self._options[CONF_DEVICE_POLLING] = self.config_entry.options.get(
+                    CONF_DEVICE_POLLING, {}
+                )
+                if device_id := self._options.pop(CONF_DEVICE, None):
+                    self._device_id = device_id
+                    return await self.async_step_device()
+                return self.async_create_entry(data=self._options)
+
+        self._device_names = {
+            device.device_id: device.name for device in self._get_devices()
+        }
+        device_schema: dict[vol.Optional, SelectSelector] = {}
+        if self._device_names:
+            device_schema[vol.Optional(CONF_DEVICE)] = SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        SelectOptionDict(value=device_id, label=name)
+                        for device_id, name in self._device_names.items()
+                    ],
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            )
 
         return self.async_show_form(
             step_id="init",
@@ -169,6 +275,101 @@ class GoogleHomeOptionsFlowHandler(OptionsFlow):
                             CONF_UPDATE_INTERVAL, UPDATE_INTERVAL
                         ),
                     ): int,
+                    vol.Optional(
+                        CONF_FAST_START,
+                        default=self.config_entry.options.get(
+                            CONF_FAST_START, DEFAULT_FAST_START
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MAX_ATTRIBUTE_ITEMS,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_ATTRIBUTE_ITEMS, DEFAULT_MAX_ATTRIBUTE_ITEMS
+                        ),
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_ITEM_ENTITIES,
+                        default=self.config_entry.options.get(
+                            CONF_ITEM_ENTITIES, DEFAULT_ITEM_ENTITIES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MIN_REQUEST_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_REQUEST_TIMEOUT, DEFAULT_MIN_REQUEST_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                    vol.Optional(
+                        CONF_MAX_REQUEST_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_REQUEST_TIMEOUT, DEFAULT_MAX_REQUEST_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                    vol.Optional(
+                        CONF_HEDGED_REQUESTS,
+                        default=self.config_entry.options.get(
+                            CONF_HEDGED_REQUESTS, DEFAULT_HEDGED_REQUESTS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_STAGGER_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_STAGGER_POLLING, DEFAULT_STAGGER_POLLING
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_STREAM_UPDATES,
+                        default=self.config_entry.options.get(
+                            CONF_STREAM_UPDATES, DEFAULT_STREAM_UPDATES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MEASURE_LOAD,
+                        default=self.config_entry.options.get(
+                            CONF_MEASURE_LOAD, DEFAULT_MEASURE_LOAD
+                        ),
+                    ): bool,
+                    **device_schema,
                 }
             ),
+            errors=errors,
         )
+
+    async def async_step_device(
+        self, user_input: DevicePollingDict | None = None
+    ) -> ConfigFlowResult:
+        """Manage polling intervals of a single device."""
+        device_polling: dict[str, DevicePollingDict] = self._options[
+            CONF_DEVICE_POLLING
+        ]
+        if user_input is not None:
+            # Only intervals set by the user are stored, empty ones follow updates
+            device_polling = dict(device_polling)
+            if user_input:
+                device_polling[self._device_id] = user_input
+            else:
+                device_polling.pop(self._device_id, None)
+            self._options[CONF_DEVICE_POLLING] = device_polling
+            return self.async_create_entry(data=self._options)
+
+        intervals = device_polling.get(self._device_id, {})
+        return self.async_show_form(
+            step_id="device",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        endpoint,
+                        description={"suggested_value": intervals.get(endpoint)},
+                    ): vol.All(int, vol.Range(min=0))
+                    for endpoint in POLL_ENDPOINTS
+                }
+            ),
+            description_placeholders={
+                "device": self._device_names.get(self._device_id, self._device_id)
+            },
+        )
+
+    def _get_devices(self) -> list[GoogleHomeDevice]:
+        """Return devices of the entry if it is loaded."""
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        return entry_data[DATA_CLIENT].google_devices if entry_data else []
@@ -10,11 +10,24 @@ from homeassistant.util.dt import DATE_STR_FORMAT
 NAME: Final = "Google Home community driven integration"
 DOMAIN: Final = "google_home"
 DOMAIN_DATA: Final = f"{DOMAIN}_data"
+# Tokens and devices fetched by the config flow are kept this long for setup
+FLOW_HANDOFF_TIMEOUT: Final = 60  # sec
 MANUFACTURER: Final = "Google Home"
 
 ATTRIBUTION: Final = "json"
 ISSUE_URL: Final = "https://github.com/leikoilja/ha-google-home/issues"
 CONF_UPDATE_INTERVAL: Final = "update_interval"
+CONF_FAST_START: Final = "fast_start"
+CONF_MAX_ATTRIBUTE_ITEMS: Final = "max_attribute_items"
+CONF_ITEM_ENTITIES: Final = "item_entities"
+CONF_MIN_REQUEST_TIMEOUT: Final = "min_request_timeout"
+CONF_MAX_REQUEST_TIMEOUT: Final = "max_request_timeout"
+CONF_HEDGED_REQUESTS: Final = "hedged_requests"
+CONF_DEVICE_POLLING: Final = "device_polling"
+CONF_DEVICE: Final = "device"
+CONF_STAGGER_POLLING: Final = "stagger_polling"
+CONF_MEASURE_LOAD: Final = "measure_load"
+CONF_STREAM_UPDATES: Final = "stream_updates"
 
 DATA_CLIENT: Final = "client"
 DATA_COORDINATOR: Final = "coordinator"
@@ -25,8 +38,11 @@ MAX_PASSWORD_LENGTH: Final = 100
 
 # Icons
 ICON_TOKEN: Final = "mdi:form-textbox-password"
+ICON_ALARM: Final = "mdi:alarm"
 ICON_ALARMS: Final = "mdi:alarm-multiple"
+ICON_TIMER: Final = "mdi:timer-outline"
 ICON_TIMERS: Final = "mdi:timer-sand"
+ICON_RINGING: Final = "mdi:bell-ring"
 ICON_DO_NOT_DISTURB: Final = "mdi:minus-circle"
 ICON_ALARM_VOLUME_LOW: Final = "mdi:volume-low"
 ICON_ALARM_VOLUME_MID: Final = "mdi:volume-medium"
@@ -44,9 +60,24 @@ SERVICE_REBOOT: Final = "reboot_device"
 SERVICE_DELETE_ALARM: Final = "delete_alarm"
 SERVICE_DELETE_TIMER: Final = "delete_timer"
 SERVICE_REFRESH: Final = "refresh_devices"
+SERVICE_GET_HISTORY: Final = "get_history"
+SERVICE_PROFILE_MEMORY: Final = "profile_memory"
 SERVICE_ATTR_ALARM_ID: Final = "alarm_id"
 SERVICE_ATTR_SKIP_REFRESH: Final = "skip_refresh"
 SERVICE_ATTR_TIMER_ID: Final = "timer_id"
+SERVICE_ATTR_LIMIT: Final = "limit"
+SERVICE_ATTR_CYCLES: Final = "cycles"
+
+# Events
+EVENT_ALARM_CREATED: Final = f"{DOMAIN}_alarm_created"
+EVENT_ALARM_DELETED: Final = f"{DOMAIN}_alarm_deleted"
+EVENT_ALARM_RINGING: Final = f"{DOMAIN}_alarm_ringing"
+EVENT_ALARM_SNOOZED: Final = f"{DOMAIN}_alarm_snoozed"
+EVENT_ALARM_MISSED: Final = f"{DOMAIN}_alarm_missed"
+EVENT_TIMER_CREATED: Final = f"{DOMAIN}_timer_created"
+EVENT_TIMER_DELETED: Final = f"{DOMAIN}_timer_deleted"
+EVENT_TIMER_RINGING: Final = f"{DOMAIN}_timer_ringing"
+EVENT_TIMER_PAUSED: Final = f"{DOMAIN}_timer_paused"
 
 # Configuration and options
 CONF_ANDROID_ID: Final = "android_id"
@@ -56,14 +87,28 @@ CONF_MASTER_TOKEN: Final = "master_token"
 
 # Defaults
 DEFAULT_NAME: Final = "Google Home"
+DEFAULT_FAST_START: Final = True
+DEFAULT_MAX_ATTRIBUTE_ITEMS: Final = 0  # Unlimited
+DEFAULT_ITEM_ENTITIES: Final = False
+DEFAULT_MIN_REQUEST_TIMEOUT: Final = 1.0  # sec
+DEFAULT_MAX_REQUEST_TIMEOUT: Final = 10.0  # sec
+DEFAULT_HEDGED_REQUESTS: Final = False
+DEFAULT_STAGGER_POLLING: Final = True
+DEFAULT_MEASURE_LOAD: Final = False
+DEFAULT_STREAM_UPDATES: Final = False
 GOOGLE_HOME_ALARM_DEFAULT_VALUE: Final = 0
 
+LABEL_ALARM: Final = "alarm"
 LABEL_ALARMS: Final = "alarms"
 LABEL_ALARM_VOLUME: Final = "alarm volume"
 LABEL_AVAILABLE: Final = "available"
+LABEL_TIMER: Final = "timer"
 LABEL_TIMERS: Final = "timers"
 LABEL_DEVICE: Final = "device"
 LABEL_DO_NOT_DISTURB: Final = "Do Not Disturb"
+LABEL_NEXT_ALARM: Final = "next alarm"
+LABEL_NEXT_TIMER: Final = "next timer"
+LABEL_ACTIVE_ITEMS: Final = "active alarms and timers"
 
 # DEVICE PORT
 PORT: Final = 8443
@@ -75,16 +120,109 @@ API_ENDPOINT_ALARM_VOLUME: Final = "setup/assistant/alarms/volume"
 API_ENDPOINT_REBOOT: Final = "setup/reboot"
 API_ENDPOINT_DO_NOT_DISTURB: Final = "setup/assistant/notifications"
 
+# Racing connections to addresses of dual-stack devices
+ADDRESS_RACE_DELAY: Final = 0.25  # sec, between attempts, as in RFC 8305
+ADDRESS_RACE_TIMEOUT: Final = 2  # sec
+
+# Zeroconf discovery
+CAST_SERVICE_TYPE: Final = "_googlecast._tcp.local."
+CAST_GROUP_MODEL: Final = "Google Cast Group"
+DISCOVERY_TIMEOUT: Final = 2  # sec
+ZEROCONF_PROPERTY_FRIENDLY_NAME: Final = "fn"
+ZEROCONF_PROPERTY_MODEL: Final = "md"
+ZEROCONF_PROPERTY_UNIQUE_ID: Final = "cd"
+
+# Worker threads for blocking cloud calls (tokens and homegraph)
+CLOUD_EXECUTOR_MAX_WORKERS: Final = 2
+# Cloud calls allowed at once, refilled by one call every period
+CLOUD_RATE_LIMIT_BURST: Final = 5
+CLOUD_RATE_LIMIT_PERIOD: Final = 60  # sec
+# Cloud calls are paused after a failure, doubled on every further failure
+CLOUD_BACKOFF_INITIAL: Final = 30  # sec
+CLOUD_BACKOFF_MAX: Final = 30 * 60  # sec
+
+# Tokens are renewed in the background this long before they expire
+ACCESS_TOKEN_LIFETIME: Final = 60 * 60  # sec
+LOCAL_AUTH_TOKEN_LIFETIME: Final = 24 * 60 * 60  # sec
+TOKEN_REFRESH_MARGIN: Final = 10 * 60  # sec
+TOKEN_REFRESH_MIN_INTERVAL: Final = 5 * 60  # sec
+# Check again after this long if token ages are unknown or a refresh
+# didn't bring new local auth tokens
+TOKEN_REFRESH_RETRY: Final = 30 * 60  # sec
+
 # HEADERS
 HEADER_CAST_LOCAL_AUTH: Final = "cast-local-authorization-token"
 HEADER_CONTENT_TYPE: Final = "content-type"
-
-TIMEOUT: Final = 2  # Request Timeout in seconds
+CONTENT_TYPE_JSON: Final = "application/json"
+
+TIMEOUT: Final = 2  # Request Timeout in seconds until latency of device is known
+
+# Adaptive request timeout: mean latency + weight * mean deviation
+LATENCY_MEAN_GAIN: Final = 1 / 8
+LATENCY_DEVIATION_GAIN: Final = 1 / 4
+LATENCY_DEVIATION_WEIGHT: Final = 4
+# Timeout is doubled after a timed out request, up to this many times and
+# no longer than TIMEOUT or the estimate
+LATENCY_MAX_BACKOFF_STEPS: Final = 2
+# Samples needed before latency percentiles are estimated
+LATENCY_MIN_SAMPLES: Final = 5
+
+# Retries of polling requests that timed out or failed
+REQUEST_RETRIES: Final = 2
+RETRY_BACKOFF: Final = 0.5  # sec, doubled on every retry
+RETRY_THROTTLE_MAX_TOKENS: Final = 10
+RETRY_THROTTLE_SUCCESS_TOKENS: Final = 0.1
+
+# Concurrent requests per device, background polling may use fewer slots
+# so that user initiated commands never queue behind it. A hedged poll
+# takes one more slot, still leaving one for user initiated commands.
+MAX_DEVICE_REQUESTS: Final = 3
+MAX_BACKGROUND_DEVICE_REQUESTS: Final = 1
+MAX_HEDGED_DEVICE_REQUESTS: Final = 2
 
 # TIMESTRINGS
 TIME_STR_FORMAT: Final = "%H:%M:%S"
 DATETIME_STR_FORMAT: Final = f"{DATE_STR_FORMAT} {TIME_STR_FORMAT}"
 
+# Endpoints whose polling can be configured per device
+POLL_ALARMS: Final = "alarms"
+POLL_ALARM_VOLUME: Final = "alarm_volume"
+POLL_DO_NOT_DISTURB: Final = "do_not_disturb"
+POLL_ENDPOINTS: Final = (POLL_ALARMS, POLL_ALARM_VOLUME, POLL_DO_NOT_DISTURB)
+# Devices still polled this long after the last poll started are published
+# with their last known data, and updated once their poll finishes.
+POLL_CYCLE_DEADLINE: Final = 30  # sec
+# Updates are not exactly on time, an endpoint due in this many seconds is polled
+POLL_INTERVAL_TOLERANCE: Final = 5  # sec
+
+# Learned endpoint support of devices and hardware models
+CAPABILITIES_STORAGE_VERSION: Final = 1
+CAPABILITIES_SAVE_DELAY: Final = 60  # sec
+CAPABILITY_RECHECK_INTERVAL: Final = 24 * 60 * 60  # sec
+
+# Scheduled updates spread polls of the devices over this part of the interval
+STAGGER_FRACTION: Final = 0.5
+STAGGER_JITTER: Final = 0.5  # sec
+
+# Event loop lag and CPU use sampling
+LOAD_MONITOR_INTERVAL: Final = 0.5  # sec
+LOAD_MONITOR_SAMPLES: Final = 1200
+
+# Poll snapshots kept in memory per device
+HISTORY_SIZE: Final = 100
+
+# Outdated entries allowed in the house-wide alarm and timer heaps
+INDEX_HEAP_SLACK: Final = 32
+
+# Memory profiling service
+MEMORY_PROFILE_CYCLES: Final = 3
+MEMORY_PROFILE_MAX_CYCLES: Final = 20
+MEMORY_PROFILE_TOP: Final = 10
+
+# Persisted device inventory
+INVENTORY_STORAGE_VERSION: Final = 1
+INVENTORY_SAVE_DELAY: Final = 60  # sec
+
 # Access token only lives about 1 hour
 # Update often to fetch timers in timely manner
 UPDATE_INTERVAL: Final = 180  # sec
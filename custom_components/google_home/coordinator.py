@@ -0,0 +1,145 @@
+"""Data update coordinator for Google Home."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import SENSOR, STAGGER_FRACTION
+from .monitor import LoadMonitor
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import GlocaltokensApiClient
+    from .models import GoogleHomeDevice
+    from .types import GoogleHomeConfigEntry
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class GoogleHomeCoordinator(DataUpdateCoordinator[list["GoogleHomeDevice"]]):
+    """Coordinator polling Google Home devices.
+
+    Scheduled updates spread the polls of the devices evenly over a part of
+    the update interval, instead of polling all of them at the same moment.
+    The next update is scheduled that much earlier, so every device is still
+    polled once per update interval. Refreshes requested by the user and the
+    first refresh poll all devices right away.
+
+    Devices still being polled at the cycle deadline keep their last known
+    data, listeners are called again once their poll finishes.
+
+    When streaming, and always when polls are spread, entities of a device
+    are updated as soon as the poll of that device finishes. Entities register
+    with their device ID as context, and those already updated are skipped at
+    the end of the cycle. A refresh may run while a spread cycle is still in
+    flight, a device is late only once no cycle is polling anymore.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: GoogleHomeConfigEntry,
+        client: GlocaltokensApiClient,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, name=SENSOR, config_entry=entry)
+        self.client = client
+        client.device_result_callback = self._handle_device_result
+        self.load_monitor = LoadMonitor(hass.loop)
+        self._stagger_window = 0.0
+        self._immediate_refresh = False
+        self._polling_cycles = 0
+        # Devices whose entities were updated while polling
+        self._streamed_devices: set[str] = set()
+
+    def set_polling(self, poll_interval: int, stagger: bool) -> None:
+        """Change how often and how spread out devices are polled."""
+        self._stagger_window = poll_interval * STAGGER_FRACTION if stagger else 0.0
+        # This property has a setter
+        self.update_interval = timedelta(  # type: ignore[misc]
+            seconds=poll_interval - self._stagger_window
+        )
+        _LOGGER.debug(
+            "Devices are polled every %s, spread over %s",
+            timedelta(seconds=poll_interval),
+            timedelta(seconds=self._stagger_window),
+        )
+
+    def set_load_monitoring(self, enabled: bool) -> None:
+        """Start or stop measuring event loop lag and CPU use."""
+        if enabled:
+            self.load_monitor.start()
+        else:
+            self.load_monitor.stop()
+
+    async def async_refresh(self) -> None:
+        """Refresh data of all devices right away."""
+        self._immediate_refresh = True
+        try:
+            await super().async_refresh()
+        finally:
+            self._immediate_refresh = False
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh data of all devices right away for the first time."""
+        self._immediate_refresh = True
+        try:
+            await super().async_config_entry_first_refresh()
+        finally:
+            self._immediate_refresh = False
+
+    async def async_shutdown(self) -> None:
+        """Stop measuring load when the entry is unloaded."""
+        await super().async_shutdown()
+        self.load_monitor.stop()
+
+    @callback
+    def _handle_device_result(self, device: GoogleHomeDevice) -> None:
+        """Publish data of a device as soon as its poll finishes."""
+        if self.data is None or device not in self.data:
+            # New device, it is published with the rest of the cycle
+            return
+        if not self._polling_cycles:
+            # Poll finished after the deadline of its cycle
+            self.async_update_listeners()
+        elif self.last_update_success:
+            # After a failed update entities turn available with the whole cycle
+            self._streamed_devices.add(device.device_id)
+            self._async_update_device_listeners(device.device_id)
+
+    @callback
+    def _async_update_device_listeners(self, device_id: str) -> None:
+        """Update entities of a single device."""
+        for update_callback, context in list(self._listeners.values()):
+            if context == device_id:
+                update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, except entities already updated while polling."""
+        streamed_devices = self._streamed_devices
+        self._streamed_devices = set()
+        if not streamed_devices or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context not in streamed_devices:
+                update_callback()
+
+    async def _async_update_data(self) -> list[GoogleHomeDevice]:
+        """Poll the devices."""
+        # Devices may be polled again, their entities are updated at the end
+        self._streamed_devices = set()
+        self._polling_cycles += 1
+        try:
+            return await self.client.update_google_devices_information(
+                stagger_window=0.0 if self._immediate_refresh else self._stagger_window
+            )
+        finally:
+            self._polling_cycles -= 1
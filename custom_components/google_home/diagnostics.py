@@ -0,0 +1,101 @@
+"""Diagnostics support for Google Home."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+
+from .const import (
+    CONF_ANDROID_ID,
+    CONF_MASTER_TOKEN,
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceEntry
+
+    from .api import GlocaltokensApiClient
+    from .coordinator import GoogleHomeCoordinator
+    from .models import GoogleHomeDevice
+    from .types import GoogleHomeConfigEntry
+
+TO_REDACT = {
+    CONF_ANDROID_ID,
+    CONF_MASTER_TOKEN,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    "auth_token",
+}
+
+
+def _device_diagnostics(
+    client: GlocaltokensApiClient, device: GoogleHomeDevice
+) -> Mapping[str, object]:
+    """Return diagnostics of a single device."""
+    return {
+        "device": async_redact_data(device.as_inventory_dict(), TO_REDACT),
+        "restored": device.restored,
+        "address_verified": device.address_verified,
+        "stale": device.stale,
+        "malformed_responses": client.malformed_responses.get(device.device_id, 0),
+        "latency": client.latency.stats().get(device.device_id, {}),
+        "retry_tokens": client.retry_throttle.tokens().get(device.device_id),
+        "history": client.history.get(device.device_id),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: GoogleHomeConfigEntry
+) -> Mapping[str, object]:
+    """Return diagnostics for a config entry."""
+    client: GlocaltokensApiClient = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
+    coordinator: GoogleHomeCoordinator = hass.data[DOMAIN][entry.entry_id][
+        DATA_COORDINATOR
+    ]
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "client": {
+            "token_ages": client.token_ages(),
+            "token_refresh": client.token_refresher.stats(),
+            "last_update": client.last_update_timings,
+            "request_timeout_bounds": {
+                "min": client.latency.min_timeout,
+                "max": client.latency.max_timeout,
+            },
+            "hedged_requests": client.hedged_requests,
+            "queue_delay": client.scheduler.queue_delay_stats(),
+            "cloud_executor": client.executor.stats(),
+            "cloud_limiter": client.cloud_limiter.stats(),
+            "capabilities": client.capabilities.as_dict(),
+        },
+        "load": coordinator.load_monitor.stats(),
+        "devices": [
+            _device_diagnostics(client, device) for device in client.google_devices
+        ],
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: GoogleHomeConfigEntry, device_entry: DeviceEntry
+) -> Mapping[str, object]:
+    """Return diagnostics for a device."""
+    client: GlocaltokensApiClient = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
+    device_ids = {
+        identifier
+        for domain, identifier in device_entry.identifiers
+        if domain == DOMAIN
+    }
+    for device in client.google_devices:
+        if device.device_id in device_ids:
+            return _device_diagnostics(client, device)
+    return {}
@@ -0,0 +1,95 @@
+"""Zeroconf discovery of Google Home devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from zeroconf import ServiceStateChange
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo
+
+from .const import (
+    CAST_GROUP_MODEL,
+    CAST_SERVICE_TYPE,
+    DISCOVERY_TIMEOUT,
+    ZEROCONF_PROPERTY_FRIENDLY_NAME,
+    ZEROCONF_PROPERTY_MODEL,
+    ZEROCONF_PROPERTY_UNIQUE_ID,
+)
+
+if TYPE_CHECKING:
+    from zeroconf import Zeroconf
+    from zeroconf.asyncio import AsyncZeroconf
+
+    from .types import DiscoveryInfo
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def _get_property(info: AsyncServiceInfo, key: str) -> str | None:
+    """Return decoded TXT record property."""
+    value = info.properties.get(key.encode())
+    if value is None or isinstance(value, str):
+        return value
+    return value.decode("utf-8")
+
+
+async def async_discover_devices(
+    aiozc: AsyncZeroconf, discovery_time: float = DISCOVERY_TIMEOUT
+) -> dict[str, DiscoveryInfo]:
+    """Discover cast devices on the local network.
+
+    Returns discovered devices keyed by their cast unique id, which matches
+    agent unique id of the device in the homegraph.
+    """
+    names: set[str] = set()
+
+    def _on_service_state_change(
+        zeroconf: Zeroconf,
+        service_type: str,
+        name: str,
+        state_change: ServiceStateChange,
+    ) -> None:
+        if state_change is ServiceStateChange.Removed:
+            names.discard(name)
+        elif not name.endswith(f"_sub.{CAST_SERVICE_TYPE}"):
+            names.add(name)
+
+    browser = AsyncServiceBrowser(
+        aiozc.zeroconf, [CAST_SERVICE_TYPE], handlers=[_on_service_state_change]
+    )
+    try:
+        await asyncio.sleep(discovery_time)
+    finally:
+        await browser.async_cancel()
+
+    infos = [AsyncServiceInfo(CAST_SERVICE_TYPE, name) for name in names]
+    await asyncio.gather(
+        *[
+            info.async_request(aiozc.zeroconf, round(discovery_time * 1000))
+            for info in infos
+        ]
+    )
+
+    devices: dict[str, DiscoveryInfo] = {}
+    for info in infos:
+        model = _get_property(info, ZEROCONF_PROPERTY_MODEL)
+        friendly_name = _get_property(info, ZEROCONF_PROPERTY_FRIENDLY_NAME)
+        unique_id = _get_property(info, ZEROCONF_PROPERTY_UNIQUE_ID)
+        addresses = info.parsed_addresses()
+        if not model or not friendly_name or not unique_id or not addresses:
+            _LOGGER.debug(
+                "Discovered device %s has incomplete service info, skipping",
+                info.name,
+            )
+            continue
+        if model == CAST_GROUP_MODEL:
+            continue
+        devices[unique_id] = {
+            "name": friendly_name,
+            "model": model,
+            "addresses": addresses,
+        }
+    _LOGGER.debug("Discovered %d devices on the local network", len(devices))
+    return devices
@@ -10,7 +10,13 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DEFAULT_NAME, DOMAIN, MANUFACTURER
+from .const import (
+    CONF_MAX_ATTRIBUTE_ITEMS,
+    DEFAULT_MAX_ATTRIBUTE_ITEMS,
+    DEFAULT_NAME,
+    DOMAIN,
+    MANUFACTURER,
+)
 from .models import GoogleHomeDevice
 
 if TYPE_CHECKING:
@@ -33,7 +39,8 @@ class GoogleHomeBaseEntity(
         device_model: str | None,
     ):
         """Create Google Home base entity."""
-        super().__init__(coordinator)
+        # Context lets the coordinator update entities of a single device
+        super().__init__(coordinator, context=device_id)
         self.client = client
         self.device_id = device_id
         self.device_name = device_name
@@ -64,6 +71,15 @@ class GoogleHomeBaseEntity(
             "model": self.device_model,
         }
 
+    def max_attribute_items(self) -> int:
+        """Return maximum number of items in list attributes, 0 means unlimited."""
+        entry = self.coordinator.config_entry
+        if entry is None:
+            return DEFAULT_MAX_ATTRIBUTE_ITEMS
+        return int(
+            entry.options.get(CONF_MAX_ATTRIBUTE_ITEMS, DEFAULT_MAX_ATTRIBUTE_ITEMS)
+        )
+
     def get_device(self) -> GoogleHomeDevice | None:
         """Return the device matched by device name from the list of google devices in coordinator_data."""
         matched_devices: list[GoogleHomeDevice] = [
@@ -72,3 +88,35 @@ class GoogleHomeBaseEntity(
             if device.device_id == self.device_id
         ]
         return matched_devices[0] if matched_devices else None
+
+
+class GoogleHomeHouseEntity(
+    CoordinatorEntity[DataUpdateCoordinator[list[GoogleHomeDevice]]], ABC
+):
+    """Base entity summarizing all Google Home devices of an account."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[list[GoogleHomeDevice]],
+        client: GlocaltokensApiClient,
+        entry_id: str,
+    ):
+        """Create Google Home house entity."""
+        super().__init__(coordinator)
+        self.client = client
+        self.entry_id = entry_id
+
+    @property
+    @abstractmethod
+    def label(self) -> str:
+        """Label to use for name and unique id."""
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return f"{DEFAULT_NAME} {self.label}"
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID to use for this entity."""
+        return f"{self.entry_id}/{self.label}"
@@ -0,0 +1,72 @@
+"""Events fired on changes of Google Home alarms and timers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import (
+    EVENT_ALARM_CREATED,
+    EVENT_ALARM_DELETED,
+    EVENT_ALARM_MISSED,
+    EVENT_ALARM_RINGING,
+    EVENT_ALARM_SNOOZED,
+    EVENT_TIMER_CREATED,
+    EVENT_TIMER_DELETED,
+    EVENT_TIMER_PAUSED,
+    EVENT_TIMER_RINGING,
+)
+from .models import GoogleHomeAlarmStatus, GoogleHomeTimerStatus
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .models import GoogleHomeAlarm, GoogleHomeDevice, GoogleHomeTimer
+
+ALARM_STATUS_EVENTS = {
+    GoogleHomeAlarmStatus.RINGING: EVENT_ALARM_RINGING,
+    GoogleHomeAlarmStatus.SNOOZED: EVENT_ALARM_SNOOZED,
+    GoogleHomeAlarmStatus.MISSED: EVENT_ALARM_MISSED,
+}
+
+TIMER_STATUS_EVENTS = {
+    GoogleHomeTimerStatus.RINGING: EVENT_TIMER_RINGING,
+    GoogleHomeTimerStatus.PAUSED: EVENT_TIMER_PAUSED,
+}
+
+
+@callback
+def _async_fire(
+    hass: HomeAssistant,
+    event_type: str,
+    device: GoogleHomeDevice,
+    item: GoogleHomeAlarm | GoogleHomeTimer,
+) -> None:
+    """Fire event carrying the changed alarm or timer."""
+    hass.bus.async_fire(
+        event_type,
+        {"device_id": device.device_id, "device_name": device.name, **item.as_dict()},
+    )
+
+
+@callback
+def async_fire_item_events(hass: HomeAssistant, device: GoogleHomeDevice) -> None:
+    """Fire events for alarms and timers changed by the last update of the device."""
+    if device.alarms_delta:
+        for alarm in device.alarms_delta.added:
+            _async_fire(hass, EVENT_ALARM_CREATED, device, alarm)
+        for alarm in device.alarms_delta.removed:
+            _async_fire(hass, EVENT_ALARM_DELETED, device, alarm)
+        for old_alarm, alarm in device.alarms_delta.changed:
+            if alarm.status != old_alarm.status and alarm.status in ALARM_STATUS_EVENTS:
+                _async_fire(hass, ALARM_STATUS_EVENTS[alarm.status], device, alarm)
+
+    if device.timers_delta:
+        for timer in device.timers_delta.added:
+            _async_fire(hass, EVENT_TIMER_CREATED, device, timer)
+        for timer in device.timers_delta.removed:
+            _async_fire(hass, EVENT_TIMER_DELETED, device, timer)
+        for old_timer, timer in device.timers_delta.changed:
+            if timer.status != old_timer.status and timer.status in TIMER_STATUS_EVENTS:
+                _async_fire(hass, TIMER_STATUS_EVENTS[timer.status], device, timer)
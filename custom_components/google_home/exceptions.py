@@ -5,3 +5,15 @@ from homeassistant.exceptions import HomeAssistantError
 
 class InvalidMasterToken(HomeAssistantError):
     """Error to indicate the master token is invalid."""
+
+
+class CloudRequestError(HomeAssistantError):
+    """Error to indicate a request to Google cloud failed."""
+
+
+class CloudRateLimited(CloudRequestError):
+    """Error to indicate a cloud call was skipped by the rate limiter."""
+
+
+class MalformedResponse(HomeAssistantError):
+    """Error to indicate a response of a device couldn't be parsed."""
@@ -0,0 +1,110 @@
+"""Dedicated executor for blocking cloud calls of Google Home."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from .const import CLOUD_EXECUTOR_MAX_WORKERS, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .types import ExecutorJobStats, ExecutorStats
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class CloudExecutor:
+    """Bounded executor for blocking glocaltokens calls.
+
+    Keeps slow homegraph and token requests off Home Assistant's shared
+    executor, so they can't starve other integrations of threads.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_workers: int = CLOUD_EXECUTOR_MAX_WORKERS
+    ) -> None:
+        """Create the executor."""
+        self.hass = hass
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=DOMAIN
+        )
+        self._pending = 0
+        self._max_queue_depth = 0
+        self._jobs: dict[str, ExecutorJobStats] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Return number of jobs waiting for a free worker."""
+        return max(0, self._pending - self._max_workers)
+
+    async def async_run[T](self, name: str, func: Callable[[], T]) -> T:
+        """Run blocking function in the executor and record its timings."""
+        submitted = time.monotonic()
+        started: float | None = None
+
+        def _job() -> T:
+            nonlocal started
+            started = time.monotonic()
+            return func()
+
+        self._pending += 1
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        try:
+            return await self.hass.loop.run_in_executor(self._executor, _job)
+        finally:
+            self._pending -= 1
+            self._record(name, submitted, started, time.monotonic())
+
+    def _record(
+        self, name: str, submitted: float, started: float | None, finished: float
+    ) -> None:
+        """Update statistics of a finished job."""
+        if started is None:
+            # Job was cancelled before a worker picked it up
+            started = finished
+        wait = started - submitted
+        duration = finished - started
+        stats = self._jobs.setdefault(
+            name,
+            {
+                "count": 0,
+                "last_duration": 0.0,
+                "max_duration": 0.0,
+                "total_duration": 0.0,
+                "max_wait": 0.0,
+                "total_wait": 0.0,
+            },
+        )
+        stats["count"] += 1
+        stats["last_duration"] = duration
+        stats["max_duration"] = max(stats["max_duration"], duration)
+        stats["total_duration"] += duration
+        stats["max_wait"] = max(stats["max_wait"], wait)
+        stats["total_wait"] += wait
+        _LOGGER.debug(
+            "Executor job %s finished in %.3fs after waiting %.3fs",
+            name,
+            duration,
+            wait,
+        )
+
+    def stats(self) -> ExecutorStats:
+        """Return executor statistics."""
+        return {
+            "max_workers": self._max_workers,
+            "pending": self._pending,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "jobs": {name: stats.copy() for name, stats in self._jobs.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the executor without waiting for running jobs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
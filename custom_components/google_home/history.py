@@ -0,0 +1,116 @@
+"""Bounded in-memory history of Google Home device polls."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+import json
+from typing import TYPE_CHECKING
+import zlib
+
+from homeassistant.util import dt as dt_util
+
+from .const import HISTORY_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .models import (
+        GoogleHomeAlarm,
+        GoogleHomeDevice,
+        GoogleHomeItemsDelta,
+        GoogleHomeTimer,
+    )
+    from .types import ItemsDeltaDict, PollSnapshotDict
+
+
+def items_fingerprint(items: Iterable[GoogleHomeAlarm | GoogleHomeTimer]) -> str:
+    """Return short checksum of alarms or timers, equal for equal items."""
+    data = "\n".join(
+        sorted(json.dumps(item.as_json_dict(), sort_keys=True) for item in items)
+    )
+    return f"{zlib.crc32(data.encode()):08x}"
+
+
+def _delta_dict[T: (GoogleHomeAlarm, GoogleHomeTimer)](
+    delta: GoogleHomeItemsDelta[T], item_id: Callable[[T], str]
+) -> ItemsDeltaDict:
+    """Return IDs of added, removed and changed items."""
+    return {
+        "added": [item_id(item) for item in delta.added],
+        "removed": [item_id(item) for item in delta.removed],
+        "changed": [item_id(new) for _, new in delta.changed],
+    }
+
+
+def _unchanged(
+    updated: bool,
+    delta: GoogleHomeItemsDelta[GoogleHomeAlarm]
+    | GoogleHomeItemsDelta[GoogleHomeTimer]
+    | None,
+) -> bool:
+    """Return whether items are known to be the same as in the last poll."""
+    return not updated or (delta is not None and not delta)
+
+
+class DeviceHistory:
+    """Ring buffer of the latest poll snapshots of every device.
+
+    Only small snapshots are kept (fingerprints instead of alarm and timer
+    lists) and the oldest ones are dropped once a device has `size` of them,
+    so memory use is bounded and nothing is written to the recorder.
+    Fingerprints are only computed again when the deltas show a change.
+    """
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        """Initialize the history."""
+        self._size = size
+        self._snapshots: dict[str, deque[PollSnapshotDict]] = {}
+
+    def record(
+        self,
+        device: GoogleHomeDevice,
+        duration: float,
+        *,
+        alarms_updated: bool,
+        timers_updated: bool,
+    ) -> None:
+        """Store snapshot of a finished poll of the device."""
+        snapshots = self._snapshots.setdefault(
+            device.device_id, deque(maxlen=self._size)
+        )
+        previous = snapshots[-1] if snapshots else None
+        snapshot: PollSnapshotDict = {
+            "time": dt_util.utcnow().isoformat(),
+            "duration": round(duration, 3),
+            "available": device.available,
+            "alarms": (
+                previous["alarms"]
+                if previous and _unchanged(alarms_updated, device.alarms_delta)
+                else items_fingerprint(device.get_sorted_alarms())
+            ),
+            "timers": (
+                previous["timers"]
+                if previous and _unchanged(timers_updated, device.timers_delta)
+                else items_fingerprint(device.get_sorted_timers())
+            ),
+            "alarms_delta": (
+                _delta_dict(device.alarms_delta, lambda alarm: alarm.alarm_id)
+                if alarms_updated and device.alarms_delta
+                else None
+            ),
+            "timers_delta": (
+                _delta_dict(device.timers_delta, lambda timer: timer.timer_id)
+                if timers_updated and device.timers_delta
+                else None
+            ),
+        }
+        snapshots.append(snapshot)
+
+    def get(self, device_id: str, limit: int | None = None) -> list[PollSnapshotDict]:
+        """Return snapshots of the device, newest first."""
+        return list(islice(reversed(self._snapshots.get(device_id, ())), limit))
+
+    def forget(self, device_id: str) -> None:
+        """Drop snapshots of a device that is gone."""
+        self._snapshots.pop(device_id, None)
@@ -0,0 +1,184 @@
+"""House-wide index of alarms and timers of Google Home devices."""
+
+from __future__ import annotations
+
+from collections import Counter
+import heapq
+from itertools import count
+from typing import TYPE_CHECKING
+
+from .const import INDEX_HEAP_SLACK
+from .models import GoogleHomeAlarmStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .models import (
+        GoogleHomeAlarm,
+        GoogleHomeDevice,
+        GoogleHomeItemsDelta,
+        GoogleHomeTimer,
+    )
+
+
+class ItemIndex[T: (GoogleHomeAlarm, GoogleHomeTimer)]:
+    """Alarms or timers of all devices, upcoming ones ordered by fire time.
+
+    Upcoming items are kept in a heap. Replaced and removed items are left in
+    it and skipped once they reach the top, the heap is rebuilt when most of
+    it is outdated.
+    """
+
+    def __init__(
+        self, item_id: Callable[[T], str], upcoming_at: Callable[[T], int | None]
+    ) -> None:
+        """Create an empty index.
+
+        upcoming_at returns fire time of an upcoming item, None for others.
+        """
+        self._item_id = item_id
+        self._upcoming_at = upcoming_at
+        # (device ID, item ID) -> (sequence number, device, item)
+        self._items: dict[tuple[str, str], tuple[int, GoogleHomeDevice, T]] = {}
+        self._device_items: dict[str, set[str]] = {}
+        self._heap: list[tuple[int, int, tuple[str, str]]] = []
+        self._sequence = count()
+        self._statuses: Counter[object] = Counter()
+
+    def __len__(self) -> int:
+        """Return number of items of all devices."""
+        return len(self._items)
+
+    def set(self, device: GoogleHomeDevice, item: T) -> None:
+        """Add or replace an item of the device."""
+        key = (device.device_id, self._item_id(item))
+        self._remove(key)
+        sequence = next(self._sequence)
+        self._items[key] = (sequence, device, item)
+        self._device_items.setdefault(device.device_id, set()).add(key[1])
+        self._statuses[item.status] += 1
+        if (fire_time := self._upcoming_at(item)) is not None:
+            heapq.heappush(self._heap, (fire_time, sequence, key))
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        """Remove an item if it is indexed."""
+        if (entry := self._items.pop(key, None)) is None:
+            return
+        self._statuses[entry[2].status] -= 1
+        self._device_items[key[0]].discard(key[1])
+
+    def apply_delta(
+        self, device: GoogleHomeDevice, delta: GoogleHomeItemsDelta[T]
+    ) -> None:
+        """Apply items added, removed and changed by an update of the device."""
+        for item in delta.removed:
+            self._remove((device.device_id, self._item_id(item)))
+        for item in delta.added:
+            self.set(device, item)
+        for _, item in delta.changed:
+            self.set(device, item)
+        self._compact()
+
+    def replace_device(self, device: GoogleHomeDevice, items: Iterable[T]) -> None:
+        """Replace all items of the device."""
+        self.forget(device.device_id)
+        for item in items:
+            self.set(device, item)
+        self._compact()
+
+    def forget(self, device_id: str) -> None:
+        """Remove all items of the device."""
+        for item_id in self._device_items.pop(device_id, set()):
+            _, _, item = self._items.pop((device_id, item_id))
+            self._statuses[item.status] -= 1
+
+    def first(self) -> tuple[GoogleHomeDevice, T] | None:
+        """Return the upcoming item firing first and its device."""
+        heap = self._heap
+        while heap:
+            _, sequence, key = heap[0]
+            entry = self._items.get(key)
+            if entry is not None and entry[0] == sequence:
+                return entry[1], entry[2]
+            heapq.heappop(heap)
+        return None
+
+    def count(self, *statuses: object) -> int:
+        """Return number of items having one of the statuses."""
+        return sum(self._statuses[status] for status in statuses)
+
+    def _compact(self) -> None:
+        """Rebuild the heap once outdated entries outnumber the items."""
+        if len(self._heap) <= 2 * len(self._items) + INDEX_HEAP_SLACK:
+            return
+        self._heap = [
+            (fire_time, sequence, key)
+            for key, (sequence, _, item) in self._items.items()
+            if (fire_time := self._upcoming_at(item)) is not None
+        ]
+        heapq.heapify(self._heap)
+
+
+def _alarm_upcoming_at(alarm: GoogleHomeAlarm) -> int | None:
+    """Return fire time of an alarm that is going to ring or rings."""
+    if alarm.status in (GoogleHomeAlarmStatus.INACTIVE, GoogleHomeAlarmStatus.MISSED):
+        return None
+    return alarm.fire_time
+
+
+def _timer_upcoming_at(timer: GoogleHomeTimer) -> int | None:
+    """Return fire time of a timer that is running or rings, None if paused."""
+    return timer.fire_time
+
+
+class HouseIndex:
+    """Alarms and timers of all devices of an account.
+
+    Kept up to date from the alarms and timers deltas of every poll, so the
+    cost of an update depends on the number of changed items instead of all
+    items of all devices. Devices seen for the first time are indexed whole.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.alarms: ItemIndex[GoogleHomeAlarm] = ItemIndex(
+            lambda alarm: alarm.alarm_id, _alarm_upcoming_at
+        )
+        self.timers: ItemIndex[GoogleHomeTimer] = ItemIndex(
+            lambda timer: timer.timer_id, _timer_upcoming_at
+        )
+        self._devices: set[str] = set()
+
+    def apply(self, device: GoogleHomeDevice) -> None:
+        """Apply the last alarms and timers update of the device.
+
+        Must be called after every update, deltas only hold the last changes.
+        """
+        if (
+            device.device_id not in self._devices
+            or device.alarms_delta is None
+            or device.timers_delta is None
+        ):
+            # First alarms and timers of the device
+            self._add_device(device)
+            return
+        self.alarms.apply_delta(device, device.alarms_delta)
+        self.timers.apply_delta(device, device.timers_delta)
+
+    def sync(self, devices: Iterable[GoogleHomeDevice]) -> None:
+        """Index new devices whole and drop devices which are gone."""
+        device_ids = set()
+        for device in devices:
+            device_ids.add(device.device_id)
+            if device.device_id not in self._devices:
+                self._add_device(device)
+        for device_id in self._devices - device_ids:
+            self._devices.discard(device_id)
+            self.alarms.forget(device_id)
+            self.timers.forget(device_id)
+
+    def _add_device(self, device: GoogleHomeDevice) -> None:
+        """Index all alarms and timers of the device."""
+        self._devices.add(device.device_id)
+        self.alarms.replace_device(device, device.get_sorted_alarms())
+        self.timers.replace_device(device, device.get_sorted_timers())
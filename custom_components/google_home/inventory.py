@@ -0,0 +1,52 @@
+"""Persisted inventory of Google Home devices."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, INVENTORY_SAVE_DELAY, INVENTORY_STORAGE_VERSION
+from .models import GoogleHomeDevice
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .types import DeviceInventoryDict
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class DeviceInventoryStore:
+    """Last known devices and their state, used to set up entities quickly."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store = Store[list["DeviceInventoryDict"]](
+            hass, INVENTORY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.inventory"
+        )
+
+    async def async_load(self) -> list[GoogleHomeDevice]:
+        """Return devices of the last known inventory."""
+        data = await self._store.async_load()
+        if not data:
+            return []
+        try:
+            return [GoogleHomeDevice.from_inventory_dict(device) for device in data]
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning("Stored device inventory is invalid, ignoring it")
+            return []
+
+    @callback
+    def async_schedule_save(self, devices: list[GoogleHomeDevice]) -> None:
+        """Save devices to the inventory after a delay."""
+        self._store.async_delay_save(
+            lambda: [device.as_inventory_dict() for device in devices],
+            INVENTORY_SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the stored inventory."""
+        await self._store.async_remove()
@@ -0,0 +1,148 @@
+"""Latency tracking and adaptive request timeouts for Google Home devices."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from .const import (
+    DEFAULT_MAX_REQUEST_TIMEOUT,
+    DEFAULT_MIN_REQUEST_TIMEOUT,
+    LATENCY_DEVIATION_GAIN,
+    LATENCY_DEVIATION_WEIGHT,
+    LATENCY_MAX_BACKOFF_STEPS,
+    LATENCY_MEAN_GAIN,
+    LATENCY_MIN_SAMPLES,
+    TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from .types import LatencyStats
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class _LatencyEstimate:
+    """Smoothed latency and mean deviation of a single endpoint of a device."""
+
+    def __init__(self) -> None:
+        """Create an estimate without samples."""
+        self.mean: float | None = None
+        self.deviation = 0.0
+        self.samples = 0
+        self.timeouts = 0
+        self.consecutive_timeouts = 0
+        self.last: float | None = None
+
+    def add_sample(self, latency: float) -> None:
+        """Update the moving averages with a successful request."""
+        if self.mean is None:
+            self.mean = latency
+            self.deviation = latency / 2
+        else:
+            self.deviation += LATENCY_DEVIATION_GAIN * (
+                abs(latency - self.mean) - self.deviation
+            )
+            self.mean += LATENCY_MEAN_GAIN * (latency - self.mean)
+        self.samples += 1
+        self.consecutive_timeouts = 0
+        self.last = latency
+
+
+class LatencyTracker:
+    """Track request latency per device and endpoint.
+
+    The timeout of a request is derived like TCP's retransmission timeout:
+    an exponentially weighted moving average of the latency plus a multiple
+    of its mean deviation, kept within the configured bounds. A timed out
+    request doubles the next timeout (a few times at most), so a device that
+    is merely slow for a moment isn't reported unavailable. The doubled
+    timeout never exceeds the initial timeout or the estimate itself, so a
+    dead device doesn't make the poll cycle longer than it used to be.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = DEFAULT_MIN_REQUEST_TIMEOUT,
+        max_timeout: float = DEFAULT_MAX_REQUEST_TIMEOUT,
+    ) -> None:
+        """Initialize the tracker."""
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._estimates: dict[tuple[str, str], _LatencyEstimate] = {}
+
+    def set_bounds(self, min_timeout: float, max_timeout: float) -> None:
+        """Change the bounds of the timeouts."""
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+
+    def _clamp(self, timeout: float) -> float:
+        """Keep timeout within the configured bounds."""
+        return min(max(timeout, self.min_timeout), self.max_timeout)
+
+    def timeout(self, device_id: str, endpoint: str) -> float:
+        """Return timeout in seconds for the next request to the endpoint."""
+        estimate = self._estimates.get((device_id, endpoint))
+        if estimate is None or estimate.mean is None:
+            base = TIMEOUT
+        else:
+            base = estimate.mean + LATENCY_DEVIATION_WEIGHT * estimate.deviation
+        if estimate is not None and estimate.consecutive_timeouts:
+            backoff = 2 ** min(estimate.consecutive_timeouts, LATENCY_MAX_BACKOFF_STEPS)
+            base = min(base * backoff, max(base, TIMEOUT))
+        return self._clamp(base)
+
+    def percentile_95(self, device_id: str, endpoint: str) -> float | None:
+        """Return estimated 95th percentile of latency, if enough is known.
+
+        Mean deviation is about 0.8 standard deviations for normally
+        distributed latency, so two of them are close to 1.645 standard
+        deviations above the mean.
+        """
+        estimate = self._estimates.get((device_id, endpoint))
+        if (
+            estimate is None
+            or estimate.mean is None
+            or estimate.samples < LATENCY_MIN_SAMPLES
+        ):
+            return None
+        return estimate.mean + 2 * estimate.deviation
+
+    def record_success(self, device_id: str, endpoint: str, latency: float) -> None:
+        """Record latency of a request that got a response."""
+        self._estimates.setdefault(
+            (device_id, endpoint), _LatencyEstimate()
+        ).add_sample(latency)
+
+    def record_timeout(self, device_id: str, endpoint: str) -> None:
+        """Record a request that timed out."""
+        estimate = self._estimates.setdefault((device_id, endpoint), _LatencyEstimate())
+        estimate.timeouts += 1
+        estimate.consecutive_timeouts += 1
+        _LOGGER.debug(
+            "Request to %s of device %s timed out %d times in a row, "
+            "next timeout is %.2fs",
+            endpoint,
+            device_id,
+            estimate.consecutive_timeouts,
+            self.timeout(device_id, endpoint),
+        )
+
+    def forget(self, device_id: str) -> None:
+        """Drop the estimates of a device, e.g. after its address changed."""
+        for key in [key for key in self._estimates if key[0] == device_id]:
+            del self._estimates[key]
+
+    def stats(self) -> dict[str, dict[str, LatencyStats]]:
+        """Return latency statistics per device and endpoint."""
+        stats: dict[str, dict[str, LatencyStats]] = {}
+        for (device_id, endpoint), estimate in self._estimates.items():
+            stats.setdefault(device_id, {})[endpoint] = {
+                "mean": estimate.mean,
+                "deviation": estimate.deviation,
+                "last": estimate.last,
+                "samples": estimate.samples,
+                "timeouts": estimate.timeouts,
+                "timeout": self.timeout(device_id, endpoint),
+            }
+        return stats
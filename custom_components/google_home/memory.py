@@ -0,0 +1,173 @@
+"""Profile memory use of the Google Home integration."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, cast
+
+import voluptuous as vol
+
+from homeassistant.core import SupportsResponse, callback
+
+from .const import (
+    DOMAIN,
+    MEMORY_PROFILE_CYCLES,
+    MEMORY_PROFILE_MAX_CYCLES,
+    MEMORY_PROFILE_TOP,
+    SERVICE_ATTR_CYCLES,
+    SERVICE_ATTR_LIMIT,
+    SERVICE_PROFILE_MEMORY,
+)
+from .models import GoogleHomeAlarm, GoogleHomeDevice, GoogleHomeTimer
+
+if TYPE_CHECKING:
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        HomeAssistant,
+        ServiceCall,
+        ServiceResponse,
+    )
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    from .api import GlocaltokensApiClient
+    from .types import AllocationSiteDict, LiveObjectsDict, MemoryProfileDict
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+PACKAGE_DIR = Path(__file__).parent
+MODEL_CLASSES: tuple[type, ...] = (GoogleHomeDevice, GoogleHomeAlarm, GoogleHomeTimer)
+
+# Tracing is global to the interpreter, profile one entry at a time
+_PROFILE_LOCK = asyncio.Lock()
+
+PROFILE_MEMORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(SERVICE_ATTR_CYCLES, default=MEMORY_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MEMORY_PROFILE_MAX_CYCLES)
+        ),
+        vol.Optional(SERVICE_ATTR_LIMIT, default=MEMORY_PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Collect garbage and return traces allocated by the integration."""
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(inclusive=True, filename_pattern=str(PACKAGE_DIR / "*"))]
+    )
+
+
+def count_live_objects() -> dict[str, LiveObjectsDict]:
+    """Return number and shallow size of live devices, alarms and timers."""
+    stats: dict[type, LiveObjectsDict] = {
+        cls: {"count": 0, "size": 0} for cls in MODEL_CLASSES
+    }
+    for obj in gc.get_objects():
+        if (entry := stats.get(type(obj))) is not None:
+            entry["count"] += 1
+            entry["size"] += sys.getsizeof(obj) + sys.getsizeof(vars(obj))
+    return {cls.__name__: entry for cls, entry in stats.items()}
+
+
+def _allocation_sites(
+    after: tracemalloc.Snapshot, before: tracemalloc.Snapshot, limit: int
+) -> list[AllocationSiteDict]:
+    """Return lines which allocated the most memory between snapshots."""
+    sites: list[AllocationSiteDict] = []
+    for stat in after.compare_to(before, "lineno")[:limit]:
+        frame = stat.traceback[0]
+        filename = Path(frame.filename).relative_to(PACKAGE_DIR)
+        sites.append(
+            {
+                "site": f"{filename}:{frame.lineno}",
+                "size": stat.size,
+                "size_diff": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+        )
+    return sites
+
+
+async def async_profile_memory(
+    hass: HomeAssistant,
+    coordinator: DataUpdateCoordinator[list[GoogleHomeDevice]],
+    client: GlocaltokensApiClient,
+    cycles: int,
+    limit: int,
+) -> MemoryProfileDict:
+    """Trace memory allocated by the integration over a number of poll cycles.
+
+    Allocations are compared between snapshots taken before the first and
+    after the last cycle, so sites still holding memory show up on top.
+    """
+    async with _PROFILE_LOCK:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            before = await hass.async_add_executor_job(_take_snapshot)
+            start = time.monotonic()
+            for cycle in range(cycles):
+                _LOGGER.debug("Profiling memory, poll cycle %d/%d", cycle + 1, cycles)
+                await coordinator.async_refresh()
+            duration = time.monotonic() - start
+            after = await hass.async_add_executor_job(_take_snapshot)
+            traced_size, traced_peak = tracemalloc.get_traced_memory()
+            # Walks every object of the interpreter, keep it off the event loop
+            objects = await hass.async_add_executor_job(count_live_objects)
+        finally:
+            if started:
+                tracemalloc.stop()
+
+    return {
+        "cycles": cycles,
+        "duration": round(duration, 3),
+        "traced_size": traced_size,
+        "traced_peak": traced_peak,
+        "allocations": _allocation_sites(after, before, limit),
+        "objects": objects,
+        "google_devices": len(client.google_devices),
+        "coordinator_devices": len(coordinator.data or []),
+    }
+
+
+@callback
+def async_register_profile_service(
+    hass: HomeAssistant,
+    coordinator: DataUpdateCoordinator[list[GoogleHomeDevice]],
+    client: GlocaltokensApiClient,
+) -> CALLBACK_TYPE:
+    """Register the memory profiling service, return a callback removing it.
+
+    The profile covers the whole integration, so it is a domain service
+    rather than a service of every device sensor.
+    """
+
+    async def _async_profile_memory(call: ServiceCall) -> ServiceResponse:
+        profile = await async_profile_memory(
+            hass,
+            coordinator,
+            client,
+            call.data[SERVICE_ATTR_CYCLES],
+            call.data[SERVICE_ATTR_LIMIT],
+        )
+        return cast("ServiceResponse", profile)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_MEMORY,
+        _async_profile_memory,
+        schema=PROFILE_MEMORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    return lambda: hass.services.async_remove(DOMAIN, SERVICE_PROFILE_MEMORY)
@@ -5,15 +5,21 @@ from __future__ import annotations
 from datetime import timedelta
 from enum import Enum
 import sys
+import time
 from typing import TYPE_CHECKING
 
 from homeassistant.util.dt import as_local, utc_from_timestamp
 
 from .const import DATETIME_STR_FORMAT, GOOGLE_HOME_ALARM_DEFAULT_VALUE
+from .exceptions import MalformedResponse
+from .network import address_family
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .types import (
         AlarmJsonDict,
+        DeviceInventoryDict,
         GoogleHomeAlarmDict,
         GoogleHomeTimerDict,
         TimerJsonDict,
@@ -25,6 +31,53 @@ def convert_from_ms_to_s(timestamp: int) -> int:
     return round(timestamp / 1000)
 
 
+def _parse_items[T: (GoogleHomeAlarm, GoogleHomeTimer)](
+    items: object, from_json: Callable[[object], T], item_id: Callable[[T], str]
+) -> dict[str, T]:
+    """Create alarms or timers from a list returned by Google Home API."""
+    if not isinstance(items, list):
+        raise MalformedResponse(f"expected a list, got {type(items).__name__}")
+    parsed: dict[str, T] = {}
+    for item_json in items:
+        item = from_json(item_json)
+        parsed[item_id(item)] = item
+    return parsed
+
+
+def diff_items[T: (GoogleHomeAlarm, GoogleHomeTimer)](
+    old_items: dict[str, T], new_items: dict[str, T]
+) -> GoogleHomeItemsDelta[T]:
+    """Compare two snapshots of alarms or timers."""
+    return GoogleHomeItemsDelta(
+        added=[item for item_id, item in new_items.items() if item_id not in old_items],
+        removed=[
+            item for item_id, item in old_items.items() if item_id not in new_items
+        ],
+        changed=[
+            (old_items[item_id], item)
+            for item_id, item in new_items.items()
+            if item_id in old_items and old_items[item_id].as_dict() != item.as_dict()
+        ],
+    )
+
+
+class GoogleHomeItemsDelta[T: (GoogleHomeAlarm, GoogleHomeTimer)]:
+    """Difference between two consecutive snapshots of alarms or timers."""
+
+    def __init__(
+        self, added: list[T], removed: list[T], changed: list[tuple[T, T]]
+    ) -> None:
+        """Create delta object."""
+        self.added = added
+        self.removed = removed
+        # Pairs of old and new item
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        """Return whether anything has changed."""
+        return bool(self.added or self.removed or self.changed)
+
+
 class GoogleHomeDevice:
     """Local representation of Google Home device."""
 
@@ -40,44 +93,127 @@ class GoogleHomeDevice:
         self.device_id = device_id
         self.name = name
         self.auth_token = auth_token
+        # Monotonic time the auth token was received from the cloud,
+        # None until it is received.
+        self.auth_token_received: float | None = None
+        # Address used for requests, the one that won the last connection race
         self.ip_address = ip_address
+        self.ip_addresses: list[str] = [ip_address] if ip_address else []
+        # Whether ip_address is known to accept connections
+        self.address_verified = False
         self.hardware = hardware
         self.available = True
+        # Last poll didn't finish in time, data is from an earlier poll
+        self.stale = False
+        # Device was restored from the last known inventory and
+        # has not been reached with its stored address yet.
+        self.restored = False
         self._do_not_disturb = False
         self._alarm_volume = GOOGLE_HOME_ALARM_DEFAULT_VALUE
-        self._timers: list[GoogleHomeTimer] = []
-        self._alarms: list[GoogleHomeAlarm] = []
+        self._timers: dict[str, GoogleHomeTimer] = {}
+        self._alarms: dict[str, GoogleHomeAlarm] = {}
+        # Changes made by the last set_alarms/set_timers call,
+        # None until alarms/timers are received for the first time.
+        self.alarms_delta: GoogleHomeItemsDelta[GoogleHomeAlarm] | None = None
+        self.timers_delta: GoogleHomeItemsDelta[GoogleHomeTimer] | None = None
+        self._alarms_loaded = False
+        self._timers_loaded = False
+
+    @classmethod
+    def from_inventory_dict(cls, data: DeviceInventoryDict) -> GoogleHomeDevice:
+        """Create device from its last known inventory representation."""
+        device = cls(
+            device_id=data["device_id"],
+            name=data["name"],
+            # Auth tokens grant local control and are not persisted
+            auth_token=None,
+            ip_address=data["ip_address"],
+            hardware=data["hardware"],
+        )
+        device.set_ip_addresses(data.get("ip_addresses", device.ip_addresses))
+        device.available = data["available"]
+        device.restored = True
+        device.set_do_not_disturb(data["do_not_disturb"])
+        device.set_alarm_volume(data["alarm_volume"])
+        device.set_alarms(data["alarms"])
+        device.set_timers(data["timers"])
+        return device
+
+    def as_inventory_dict(self) -> DeviceInventoryDict:
+        """Return representation of the device to be persisted."""
+        return {
+            "device_id": self.device_id,
+            "name": self.name,
+            "ip_address": self.ip_address,
+            "ip_addresses": self.ip_addresses,
+            "hardware": self.hardware,
+            "available": self.available,
+            "do_not_disturb": self._do_not_disturb,
+            "alarm_volume": self._alarm_volume,
+            "alarms": [alarm.as_json_dict() for alarm in self._alarms.values()],
+            "timers": [timer.as_json_dict() for timer in self._timers.values()],
+        }
+
+    def set_ip_addresses(self, addresses: list[str]) -> None:
+        """Store all known addresses of the device.
+
+        The address in use is kept if it is still known, otherwise one of the
+        same family is preferred, as that family worked last time.
+        """
+        self.ip_addresses = addresses
+        if self.ip_address in addresses:
+            return
+        family = address_family(self.ip_address) if self.ip_address else None
+        self.ip_address = next(
+            (address for address in addresses if address_family(address) == family),
+            addresses[0] if addresses else None,
+        )
+        self.address_verified = False
+
+    def set_auth_token(self, auth_token: str | None) -> None:
+        """Store auth token received from the cloud."""
+        if auth_token != self.auth_token or self.auth_token_received is None:
+            self.auth_token_received = time.monotonic()
+        self.auth_token = auth_token
 
     def set_alarms(self, alarms: list[AlarmJsonDict]) -> None:
         """Store alarms as GoogleHomeAlarm objects."""
-        self._alarms = [
-            GoogleHomeAlarm(
-                alarm_id=alarm["id"],
-                fire_time=alarm["fire_time"],
-                status=alarm["status"],
-                label=alarm.get("label"),
-                recurrence=alarm.get("recurrence"),
-            )
-            for alarm in alarms
-        ]
+        self._store_alarms(_parse_alarms(alarms))
 
     def set_timers(self, timers: list[TimerJsonDict]) -> None:
         """Store timers as GoogleHomeTimer objects."""
-        self._timers = [
-            GoogleHomeTimer(
-                timer_id=timer["id"],
-                fire_time=timer.get("fire_time"),
-                duration=timer["original_duration"],
-                status=timer["status"],
-                label=timer.get("label"),
-            )
-            for timer in timers
-        ]
+        self._store_timers(_parse_timers(timers))
+
+    def set_alarms_and_timers(self, alarms: object, timers: object) -> None:
+        """Store alarms and timers of a response, validating them while parsing.
+
+        Raises MalformedResponse and keeps both unchanged if either is invalid.
+        """
+        parsed_alarms = _parse_alarms(alarms)
+        parsed_timers = _parse_timers(timers)
+        self._store_timers(parsed_timers)
+        self._store_alarms(parsed_alarms)
+
+    def _store_alarms(self, alarms: dict[str, GoogleHomeAlarm]) -> None:
+        """Replace alarms and record what has changed."""
+        old_alarms = self._alarms
+        self._alarms = alarms
+        if self._alarms_loaded:
+            self.alarms_delta = diff_items(old_alarms, self._alarms)
+        self._alarms_loaded = True
+
+    def _store_timers(self, timers: dict[str, GoogleHomeTimer]) -> None:
+        """Replace timers and record what has changed."""
+        old_timers = self._timers
+        self._timers = timers
+        if self._timers_loaded:
+            self.timers_delta = diff_items(old_timers, self._timers)
+        self._timers_loaded = True
 
     def get_sorted_alarms(self) -> list[GoogleHomeAlarm]:
         """Return alarms in a sorted order. Inactive & missed alarms are at the end."""
         return sorted(
-            self._alarms,
+            self._alarms.values(),
             key=lambda k: (
                 k.fire_time
                 if k.status
@@ -91,10 +227,18 @@ class GoogleHomeDevice:
         alarms = self.get_sorted_alarms()
         return alarms[0] if alarms else None
 
+    def get_alarm(self, alarm_id: str) -> GoogleHomeAlarm | None:
+        """Return alarm by its ID."""
+        return self._alarms.get(alarm_id)
+
+    def get_alarm_ids(self) -> list[str]:
+        """Return IDs of all alarms."""
+        return list(self._alarms)
+
     def get_sorted_timers(self) -> list[GoogleHomeTimer]:
         """Return timers in a sorted order. If timer is paused, put it in the end."""
         return sorted(
-            self._timers,
+            self._timers.values(),
             key=lambda k: k.fire_time if k.fire_time is not None else sys.maxsize,
         )
 
@@ -103,6 +247,14 @@ class GoogleHomeDevice:
         timers = self.get_sorted_timers()
         return timers[0] if timers else None
 
+    def get_timer(self, timer_id: str) -> GoogleHomeTimer | None:
+        """Return timer by its ID."""
+        return self._timers.get(timer_id)
+
+    def get_timer_ids(self) -> list[str]:
+        """Return IDs of all timers."""
+        return list(self._timers)
+
     def set_do_not_disturb(self, status: bool) -> None:
         """Set Do Not Disturb status."""
         self._do_not_disturb = status
@@ -133,6 +285,7 @@ class GoogleHomeTimer:
     ) -> None:
         """Create Google Home Timer object."""
         self.timer_id = timer_id
+        self.original_duration = duration
         self.duration = str(timedelta(seconds=convert_from_ms_to_s(duration)))
         self.status = GoogleHomeTimerStatus(status)
         self.label = label
@@ -148,6 +301,28 @@ class GoogleHomeTimer:
             self.local_time = dt_local.strftime(DATETIME_STR_FORMAT)
             self.local_time_iso = dt_local.isoformat()
 
+    @classmethod
+    def from_json(cls, timer: object) -> GoogleHomeTimer:
+        """Create timer from its representation in Google Home API.
+
+        Raises MalformedResponse if a required key is missing or invalid.
+        """
+        if not isinstance(timer, dict):
+            raise MalformedResponse(f"timer is a {type(timer).__name__}")
+        if not isinstance(timer_id := timer.get("id"), str):
+            raise MalformedResponse("timer id is missing or not a string")
+        try:
+            fire_time = timer.get("fire_time")
+            return cls(
+                timer_id=timer_id,
+                fire_time=None if fire_time is None else int(fire_time),
+                duration=int(timer["original_duration"]),
+                status=timer["status"],
+                label=timer.get("label"),
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            raise MalformedResponse(f"invalid timer: {err!r}") from err
+
     def as_dict(self) -> GoogleHomeTimerDict:
         """Return typed dict representation."""
         return {
@@ -160,6 +335,18 @@ class GoogleHomeTimer:
             "label": self.label,
         }
 
+    def as_json_dict(self) -> TimerJsonDict:
+        """Return representation in the format of Google Home API."""
+        json_dict: TimerJsonDict = {
+            "id": self.timer_id,
+            "original_duration": self.original_duration,
+            "status": self.status.value,
+            "label": self.label,
+        }
+        if self.fire_time is not None:
+            json_dict["fire_time"] = self.fire_time * 1000
+        return json_dict
+
 
 class GoogleHomeAlarm:
     """Local representation of Google Home alarm."""
@@ -184,6 +371,27 @@ class GoogleHomeAlarm:
         self.local_time = dt_local.strftime(DATETIME_STR_FORMAT)
         self.local_time_iso = dt_local.isoformat()
 
+    @classmethod
+    def from_json(cls, alarm: object) -> GoogleHomeAlarm:
+        """Create alarm from its representation in Google Home API.
+
+        Raises MalformedResponse if a required key is missing or invalid.
+        """
+        if not isinstance(alarm, dict):
+            raise MalformedResponse(f"alarm is a {type(alarm).__name__}")
+        if not isinstance(alarm_id := alarm.get("id"), str):
+            raise MalformedResponse("alarm id is missing or not a string")
+        try:
+            return cls(
+                alarm_id=alarm_id,
+                fire_time=int(alarm["fire_time"]),
+                status=alarm["status"],
+                label=alarm.get("label"),
+                recurrence=alarm.get("recurrence"),
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            raise MalformedResponse(f"invalid alarm: {err!r}") from err
+
     def as_dict(self) -> GoogleHomeAlarmDict:
         """Return typed dict representation."""
         return {
@@ -196,6 +404,16 @@ class GoogleHomeAlarm:
             "recurrence": self.recurrence,
         }
 
+    def as_json_dict(self) -> AlarmJsonDict:
+        """Return representation in the format of Google Home API."""
+        return {
+            "id": self.alarm_id,
+            "fire_time": self.fire_time * 1000,
+            "status": self.status.value,
+            "label": self.label,
+            "recurrence": self.recurrence,
+        }
+
 
 class GoogleHomeAlarmStatus(Enum):
     """Definition of Google Home alarm status."""
@@ -215,3 +433,13 @@ class GoogleHomeTimerStatus(Enum):
     SET = 1
     PAUSED = 2
     RINGING = 3
+
+
+def _parse_alarms(alarms: object) -> dict[str, GoogleHomeAlarm]:
+    """Create alarms from a list returned by Google Home API."""
+    return _parse_items(alarms, GoogleHomeAlarm.from_json, lambda alarm: alarm.alarm_id)
+
+
+def _parse_timers(timers: object) -> dict[str, GoogleHomeTimer]:
+    """Create timers from a list returned by Google Home API."""
+    return _parse_items(timers, GoogleHomeTimer.from_json, lambda timer: timer.timer_id)
@@ -0,0 +1,97 @@
+"""Measure event loop lag and CPU use while Google Home devices are polled."""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from .const import LOAD_MONITOR_INTERVAL, LOAD_MONITOR_SAMPLES
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .types import LoadStats
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    """Return percentile of sorted values."""
+    return values[min(int(len(values) * percentile), len(values) - 1)]
+
+
+class LoadMonitor:
+    """Sample event loop lag and CPU use of the process.
+
+    A callback is scheduled every interval, how late it runs is the lag of
+    the event loop. CPU use is process time spent between two samples.
+    Only the latest samples are kept.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, interval: float = LOAD_MONITOR_INTERVAL
+    ) -> None:
+        """Initialize the monitor."""
+        self._loop = loop
+        self._interval = interval
+        self._lags: deque[float] = deque(maxlen=LOAD_MONITOR_SAMPLES)
+        self._cpu: deque[float] = deque(maxlen=LOAD_MONITOR_SAMPLES)
+        self._handle: asyncio.TimerHandle | None = None
+        self._last_sample = 0.0
+        self._last_process_time = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Return whether samples are being taken."""
+        return self._handle is not None
+
+    def start(self) -> None:
+        """Start taking samples."""
+        if self._handle is not None:
+            return
+        self._last_sample = self._loop.time()
+        self._last_process_time = time.process_time()
+        self._schedule(self._last_sample + self._interval)
+
+    def stop(self) -> None:
+        """Stop taking samples and forget them."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._lags.clear()
+        self._cpu.clear()
+
+    def _schedule(self, when: float) -> None:
+        """Schedule the next sample."""
+        self._handle = self._loop.call_at(when, self._sample, when)
+
+    def _sample(self, expected: float) -> None:
+        """Record lag of this callback and CPU use since the previous one."""
+        now = self._loop.time()
+        process_time = time.process_time()
+        self._lags.append(now - expected)
+        if now > self._last_sample:
+            self._cpu.append(
+                (process_time - self._last_process_time) / (now - self._last_sample)
+            )
+        self._last_sample = now
+        self._last_process_time = process_time
+        self._schedule(now + self._interval)
+
+    def stats(self) -> LoadStats | None:
+        """Return statistics of the kept samples, None if there are none."""
+        if not self._lags or not self._cpu:
+            return None
+        lags = sorted(self._lags)
+        cpu = sorted(self._cpu)
+        return {
+            "samples": len(lags),
+            "lag_mean": sum(lags) / len(lags),
+            "lag_p99": _percentile(lags, 0.99),
+            "lag_max": lags[-1],
+            "cpu_mean": sum(cpu) / len(cpu),
+            "cpu_p99": _percentile(cpu, 0.99),
+            "cpu_max": cpu[-1],
+        }
@@ -0,0 +1,75 @@
+"""Happy eyeballs address selection for dual-stack Google Home devices."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+from itertools import chain, zip_longest
+import logging
+
+from .const import ADDRESS_RACE_DELAY, ADDRESS_RACE_TIMEOUT
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def address_family(address: str) -> int:
+    """Return IP version of the address."""
+    return ipaddress.ip_address(address).version
+
+
+def interleave_addresses(addresses: list[str], first: str | None) -> list[str]:
+    """Order addresses alternating between families, like RFC 8305 does.
+
+    Starts with the given address and its family.
+    """
+    ordered = sorted(addresses, key=lambda address: address != first)
+    first_family = address_family(ordered[0]) if ordered else None
+    preferred = [a for a in ordered if address_family(a) == first_family]
+    others = [a for a in ordered if address_family(a) != first_family]
+    return [
+        address
+        for address in chain.from_iterable(zip_longest(preferred, others))
+        if address is not None
+    ]
+
+
+async def _async_connect(address: str, port: int, delay: float) -> str:
+    """Open and close a TCP connection to the address after a delay."""
+    await asyncio.sleep(delay)
+    _, writer = await asyncio.open_connection(address, port)
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+    return address
+
+
+async def async_race_addresses(
+    addresses: list[str], port: int, first: str | None = None
+) -> str | None:
+    """Return the address that accepts a connection first.
+
+    Connection attempts are started one after another with a short delay,
+    alternating between IPv4 and IPv6, so a broken address family costs
+    only the delay instead of a full request timeout.
+    """
+    tasks = {
+        asyncio.ensure_future(_async_connect(address, port, index * ADDRESS_RACE_DELAY))
+        for index, address in enumerate(interleave_addresses(addresses, first))
+    }
+    try:
+        async with asyncio.timeout(ADDRESS_RACE_TIMEOUT):
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    _LOGGER.debug("Connection attempt failed: %r", task.exception())
+    except TimeoutError:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+    return None
@@ -0,0 +1,82 @@
+"""Per-device polling settings for Google Home."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING
+import zlib
+
+from .const import POLL_ENDPOINTS, POLL_INTERVAL_TOLERANCE, STAGGER_JITTER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .types import DevicePollingDict
+
+
+def poll_offsets(device_ids: Iterable[str], window: float) -> dict[str, float]:
+    """Return delay of the poll of every device within the window.
+
+    Devices are spaced evenly in an order given by a checksum of their IDs,
+    so every device keeps its place between updates. A little jitter keeps
+    the polls from lining up with other periodic work.
+    """
+    ordered = sorted(device_ids, key=lambda device_id: zlib.crc32(device_id.encode()))
+    return {
+        device_id: min(
+            max(
+                index * window / len(ordered)
+                + random.uniform(-STAGGER_JITTER, STAGGER_JITTER),  # noqa: S311
+                0.0,
+            ),
+            window,
+        )
+        for index, device_id in enumerate(ordered)
+    }
+
+
+class PollingSchedule:
+    """Decide which endpoints of a device are polled by an update.
+
+    Every device may have its own interval in seconds for each endpoint,
+    where 0 means the endpoint is not polled at all. Devices and endpoints
+    without settings are polled on every update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the schedule."""
+        self._settings: Mapping[str, DevicePollingDict] = {}
+        self._last_polled: dict[tuple[str, str], float] = {}
+
+    def set_settings(self, settings: Mapping[str, DevicePollingDict]) -> None:
+        """Change polling settings of the devices."""
+        self._settings = settings
+
+    def _interval(self, device_id: str, endpoint: str) -> int | None:
+        """Return polling interval of the endpoint, None if polled every update."""
+        settings = self._settings.get(device_id)
+        return settings.get(endpoint) if settings else None
+
+    def is_excluded(self, device_id: str) -> bool:
+        """Return whether none of the endpoints of the device is polled."""
+        return all(
+            self._interval(device_id, endpoint) == 0 for endpoint in POLL_ENDPOINTS
+        )
+
+    def is_due(self, device_id: str, endpoint: str) -> bool:
+        """Return whether the endpoint should be polled now."""
+        interval = self._interval(device_id, endpoint)
+        if interval is None:
+            return True
+        if interval == 0:
+            return False
+        last_polled = self._last_polled.get((device_id, endpoint))
+        return (
+            last_polled is None
+            or time.monotonic() - last_polled + POLL_INTERVAL_TOLERANCE >= interval
+        )
+
+    def mark_polled(self, device_id: str, endpoint: str) -> None:
+        """Remember when the endpoint was polled."""
+        self._last_polled[device_id, endpoint] = time.monotonic()
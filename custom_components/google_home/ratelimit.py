@@ -0,0 +1,104 @@
+"""Rate limiting of calls to Google cloud."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CLOUD_BACKOFF_INITIAL,
+    CLOUD_BACKOFF_MAX,
+    CLOUD_RATE_LIMIT_BURST,
+    CLOUD_RATE_LIMIT_PERIOD,
+)
+from .exceptions import CloudRateLimited
+
+if TYPE_CHECKING:
+    from .types import CloudLimiterStats
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class CloudRateLimiter:
+    """Limit token and homegraph requests made on behalf of the account.
+
+    A token bucket allows a burst of calls and then one call per period.
+    After a failed call no calls are made until a backoff has passed, the
+    backoff doubles on every failure in a row. Calls over the limit are
+    rejected instead of delayed, callers keep using what they already have.
+    """
+
+    def __init__(
+        self,
+        burst: int = CLOUD_RATE_LIMIT_BURST,
+        period: float = CLOUD_RATE_LIMIT_PERIOD,
+    ) -> None:
+        """Initialize the limiter with a full bucket."""
+        self._burst = burst
+        self._period = period
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._failures = 0
+        self._backoff_until = 0.0
+        self._allowed = 0
+        self._limited = 0
+        self._last_limited: str | None = None
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time passed since the last refill."""
+        self._tokens = min(
+            self._tokens + (now - self._refilled) / self._period, self._burst
+        )
+        self._refilled = now
+
+    def acquire(self, name: str) -> None:
+        """Take a token for the call or raise CloudRateLimited."""
+        now = time.monotonic()
+        self._refill(now)
+        if now < self._backoff_until:
+            reason = f"backing off for {self._backoff_until - now:.0f}s"
+        elif self._tokens < 1:
+            reason = "rate limit reached"
+        else:
+            self._tokens -= 1
+            self._allowed += 1
+            return
+        self._limited += 1
+        self._last_limited = dt_util.utcnow().isoformat()
+        _LOGGER.debug("Cloud call %s skipped, %s", name, reason)
+        raise CloudRateLimited(f"Cloud call {name} skipped, {reason}")
+
+    def record_success(self) -> None:
+        """End the backoff after a successful call."""
+        self._failures = 0
+        self._backoff_until = 0.0
+
+    def record_failure(self) -> None:
+        """Back off further calls, exponentially with jitter."""
+        backoff = min(CLOUD_BACKOFF_INITIAL * 2**self._failures, CLOUD_BACKOFF_MAX)
+        self._failures += 1
+        # Jitter of up to half the backoff, so accounts don't retry in step
+        backoff *= random.uniform(0.5, 1)  # noqa: S311
+        self._backoff_until = time.monotonic() + backoff
+        _LOGGER.debug(
+            "Cloud call failed %d time(s) in a row, backing off for %.0fs",
+            self._failures,
+            backoff,
+        )
+
+    def stats(self) -> CloudLimiterStats:
+        """Return state of the limiter."""
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "tokens": round(self._tokens, 2),
+            "failures": self._failures,
+            "backoff": round(max(self._backoff_until - now, 0.0), 1),
+            "allowed": self._allowed,
+            "limited": self._limited,
+            "last_limited": self._last_limited,
+        }
@@ -0,0 +1,53 @@
+"""Retry policy for idempotent requests to Google Home devices."""
+
+from __future__ import annotations
+
+import random
+
+from .const import (
+    RETRY_BACKOFF,
+    RETRY_THROTTLE_MAX_TOKENS,
+    RETRY_THROTTLE_SUCCESS_TOKENS,
+)
+
+
+def retry_delay(attempt: int) -> float:
+    """Return delay before the given retry, exponential backoff with full jitter."""
+    return random.uniform(0, RETRY_BACKOFF * 2**attempt)  # noqa: S311
+
+
+class RetryThrottle:
+    """Limit retries to devices that mostly respond.
+
+    Every device has a bucket of tokens. A failed request takes a token, a
+    successful one returns a fraction of a token. Retries are only allowed
+    while more than half of the tokens are left, so a struggling device
+    isn't hammered with retries of every poll.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the throttle."""
+        self._tokens: dict[str, float] = {}
+
+    def _get(self, device_id: str) -> float:
+        """Return tokens left for the device."""
+        return self._tokens.get(device_id, RETRY_THROTTLE_MAX_TOKENS)
+
+    def record_success(self, device_id: str) -> None:
+        """Return a fraction of a token after a successful request."""
+        self._tokens[device_id] = min(
+            self._get(device_id) + RETRY_THROTTLE_SUCCESS_TOKENS,
+            RETRY_THROTTLE_MAX_TOKENS,
+        )
+
+    def record_failure(self, device_id: str) -> None:
+        """Take a token after a failed request."""
+        self._tokens[device_id] = max(self._get(device_id) - 1, 0)
+
+    def allow_retry(self, device_id: str) -> bool:
+        """Return whether a failed request may be retried or hedged."""
+        return self._get(device_id) > RETRY_THROTTLE_MAX_TOKENS / 2
+
+    def tokens(self) -> dict[str, float]:
+        """Return tokens left per device."""
+        return self._tokens.copy()
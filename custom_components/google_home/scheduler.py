@@ -0,0 +1,152 @@
+"""Per-device request scheduling for Google Home."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from enum import IntEnum
+import heapq
+from itertools import count
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from .const import MAX_BACKGROUND_DEVICE_REQUESTS, MAX_DEVICE_REQUESTS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from .types import QueueDelayStats
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class RequestPriority(IntEnum):
+    """Priority class of a device request. Lower value is served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+PRIORITY_LIMITS: dict[RequestPriority, int] = {
+    RequestPriority.INTERACTIVE: MAX_DEVICE_REQUESTS,
+    RequestPriority.BACKGROUND: MAX_BACKGROUND_DEVICE_REQUESTS,
+}
+
+
+class _DeviceLane:
+    """Queue of requests waiting for a single device."""
+
+    def __init__(self) -> None:
+        """Create an empty lane."""
+        self.active = 0
+        self.waiters: list[tuple[RequestPriority, int, asyncio.Future[None]]] = []
+
+    def can_start(self, priority: RequestPriority) -> bool:
+        """Return whether a request of the given priority may start now."""
+        return self.active < PRIORITY_LIMITS[priority]
+
+    def wake_up(self) -> None:
+        """Start waiters in priority order while the limits allow it."""
+        while self.waiters:
+            priority, _, future = self.waiters[0]
+            if future.done():
+                # Waiter was cancelled while queued
+                heapq.heappop(self.waiters)
+                continue
+            if not self.can_start(priority):
+                return
+            heapq.heappop(self.waiters)
+            self.active += 1
+            future.set_result(None)
+
+
+class DeviceRequestScheduler:
+    """Schedule requests to Google Home devices.
+
+    Interactive requests (user initiated writes) are allowed to use every slot
+    of a device and jump ahead of queued background reads, while background
+    polling is limited to fewer slots so there is always room for a user action.
+    A hedged poll takes a slot of its own for the second request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._lanes: dict[str, _DeviceLane] = {}
+        self._sequence = count()
+        self._stats: dict[RequestPriority, QueueDelayStats] = {
+            priority: {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            for priority in RequestPriority
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self, device_id: str, priority: RequestPriority
+    ) -> AsyncIterator[None]:
+        """Wait for a free request slot of the device."""
+        lane = self._lanes.setdefault(device_id, _DeviceLane())
+        queued_at = time.monotonic()
+
+        if not lane.waiters and lane.can_start(priority):
+            lane.active += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(lane.waiters, (priority, next(self._sequence), future))
+            # Queued background reads must not hold back a request with a free slot
+            lane.wake_up()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Slot was granted right before cancellation, pass it on
+                    lane.active -= 1
+                    lane.wake_up()
+                raise
+
+        self._record_delay(device_id, priority, time.monotonic() - queued_at)
+        try:
+            yield
+        finally:
+            lane.active -= 1
+            lane.wake_up()
+
+    def try_acquire(self, device_id: str, limit: int) -> bool:
+        """Take a slot of the device without waiting, if one is free.
+
+        Slots taken this way are given back with release().
+        """
+        lane = self._lanes.setdefault(device_id, _DeviceLane())
+        if lane.waiters or lane.active >= limit:
+            return False
+        lane.active += 1
+        return True
+
+    def release(self, device_id: str) -> None:
+        """Give back a slot taken with try_acquire()."""
+        lane = self._lanes[device_id]
+        lane.active -= 1
+        lane.wake_up()
+
+    def _record_delay(
+        self, device_id: str, priority: RequestPriority, delay: float
+    ) -> None:
+        """Update queueing delay statistics."""
+        stats = self._stats[priority]
+        stats["count"] += 1
+        stats["total"] += delay
+        stats["last"] = delay
+        stats["max"] = max(stats["max"], delay)
+        if delay > 0.001:
+            _LOGGER.debug(
+                "%s request to device %s was queued for %.3fs",
+                priority.name.capitalize(),
+                device_id,
+                delay,
+            )
+
+    def queue_delay_stats(self) -> dict[str, QueueDelayStats]:
+        """Return queueing delay statistics per priority class."""
+        return {
+            priority.name.lower(): stats.copy()
+            for priority, stats in self._stats.items()
+        }
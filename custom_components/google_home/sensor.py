@@ -2,51 +2,81 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import voluptuous as vol
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import STATE_UNAVAILABLE
-from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_platform,
+    entity_registry as er,
+)
 from homeassistant.helpers.entity import Entity, EntityCategory
 
 from .const import (
     ALARM_AND_TIMER_ID_LENGTH,
+    CONF_ITEM_ENTITIES,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DEFAULT_ITEM_ENTITIES,
     DOMAIN,
     GOOGLE_HOME_ALARM_DEFAULT_VALUE,
+    ICON_ALARM,
     ICON_ALARMS,
+    ICON_RINGING,
+    ICON_TIMER,
     ICON_TIMERS,
     ICON_TOKEN,
+    LABEL_ACTIVE_ITEMS,
+    LABEL_ALARM,
     LABEL_ALARMS,
     LABEL_DEVICE,
+    LABEL_NEXT_ALARM,
+    LABEL_NEXT_TIMER,
+    LABEL_TIMER,
     LABEL_TIMERS,
     SERVICE_ATTR_ALARM_ID,
+    SERVICE_ATTR_LIMIT,
     SERVICE_ATTR_SKIP_REFRESH,
     SERVICE_ATTR_TIMER_ID,
     SERVICE_DELETE_ALARM,
     SERVICE_DELETE_TIMER,
+    SERVICE_GET_HISTORY,
     SERVICE_REBOOT,
     SERVICE_REFRESH,
 )
-from .entity import GoogleHomeBaseEntity
-from .models import GoogleHomeAlarmStatus, GoogleHomeDevice, GoogleHomeTimerStatus
+from .entity import GoogleHomeBaseEntity, GoogleHomeHouseEntity
+from .models import (
+    GoogleHomeAlarm,
+    GoogleHomeAlarmStatus,
+    GoogleHomeDevice,
+    GoogleHomeTimer,
+    GoogleHomeTimerStatus,
+)
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from collections.abc import Callable, Coroutine
+
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
     from .api import GlocaltokensApiClient
+    from .models import GoogleHomeItemsDelta
     from .types import (
+        ActiveItemsAttributes,
         AlarmsAttributes,
         DeviceAttributes,
         GoogleHomeAlarmDict,
         GoogleHomeConfigEntry,
         GoogleHomeTimerDict,
+        NextAlarmAttributes,
+        NextTimerAttributes,
         TimersAttributes,
     )
 
@@ -91,8 +121,20 @@ async def async_setup_entry(
                     device.hardware,
                 ),
             ]
+    # House-wide sensors, kept up to date by the index of all alarms and timers
+    client.item_index.sync(coordinator.data)
+    sensors += [
+        GoogleHomeNextAlarmSensor(coordinator, client, entry.entry_id),
+        GoogleHomeNextTimerSensor(coordinator, client, entry.entry_id),
+        GoogleHomeActiveItemsSensor(coordinator, client, entry.entry_id),
+    ]
     async_add_devices(sensors)
 
+    item_entities = GoogleHomeItemEntities(hass, coordinator, client, async_add_devices)
+    item_entities.async_remove_orphans(entry.entry_id)
+    item_entities.async_update()
+    entry.async_on_unload(coordinator.async_add_listener(item_entities.async_update))
+
     platform = entity_platform.async_get_current_platform()
 
     # Services
@@ -102,7 +144,7 @@ async def async_setup_entry(
             vol.Required(SERVICE_ATTR_ALARM_ID): cv.string,
             vol.Optional(SERVICE_ATTR_SKIP_REFRESH): cv.boolean,
         },
-        GoogleHomeAlarmsSensor.async_delete_alarm,
+        _device_entity_service(GoogleHomeAlarmsSensor.async_delete_alarm),
     )
 
     platform.async_register_entity_service(
@@ -111,24 +153,49 @@ async def async_setup_entry(
             vol.Required(SERVICE_ATTR_TIMER_ID): cv.string,
             vol.Optional(SERVICE_ATTR_SKIP_REFRESH): cv.boolean,
         },
-        GoogleHomeTimersSensor.async_delete_timer,
+        _device_entity_service(GoogleHomeTimersSensor.async_delete_timer),
     )
 
     platform.async_register_entity_service(
         SERVICE_REBOOT,
         {},
-        GoogleHomeDeviceSensor.async_reboot_device,
+        _device_entity_service(GoogleHomeDeviceSensor.async_reboot_device),
     )
 
     platform.async_register_entity_service(
         SERVICE_REFRESH,
         {},
-        GoogleHomeDeviceSensor.async_refresh_devices,
+        _device_entity_service(GoogleHomeDeviceSensor.async_refresh_devices),
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_GET_HISTORY,
+        {vol.Optional(SERVICE_ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1))},
+        _device_entity_service(GoogleHomeDeviceSensor.async_get_history),
+        supports_response=SupportsResponse.ONLY,
     )
 
     return True
 
 
+def _device_entity_service[E: GoogleHomeBaseEntity, R: ServiceResponse](
+    handler: Callable[[E, ServiceCall], Coroutine[object, object, R]],
+) -> Callable[[Entity, ServiceCall], Coroutine[object, object, ServiceResponse]]:
+    """Wrap a service handler of device entities to skip house-wide entities."""
+
+    async def _async_handle(entity: Entity, call: ServiceCall) -> ServiceResponse:
+        if not isinstance(entity, GoogleHomeBaseEntity):
+            _LOGGER.error(
+                "%s is not a sensor of a Google Home device, "
+                "target a device sensor instead.",
+                entity.entity_id,
+            )
+            return None
+        return await handler(cast("E", entity), call)
+
+    return _async_handle
+
+
 class GoogleHomeDeviceSensor(GoogleHomeBaseEntity):
     """Google Home Device sensor."""
 
@@ -156,6 +223,7 @@ class GoogleHomeDeviceSensor(GoogleHomeBaseEntity):
             "auth_token": None,
             "ip_address": None,
             "available": False,
+            "stale": False,
         }
         return self.get_device_attributes(device) if device else attributes
 
@@ -168,6 +236,7 @@ class GoogleHomeDeviceSensor(GoogleHomeBaseEntity):
             "auth_token": device.auth_token,
             "ip_address": device.ip_address,
             "available": device.available,
+            "stale": device.stale,
         }
 
     async def async_reboot_device(self, _call: ServiceCall) -> None:
@@ -184,12 +253,21 @@ class GoogleHomeDeviceSensor(GoogleHomeBaseEntity):
         """Refresh the devices."""
         await self.coordinator.async_request_refresh()
 
+    async def async_get_history(self, call: ServiceCall) -> ServiceResponse:
+        """Return the latest polls of the device, newest first."""
+        snapshots = self.client.history.get(
+            self.device_id, call.data.get(SERVICE_ATTR_LIMIT)
+        )
+        return cast("ServiceResponse", {"snapshots": snapshots})
+
 
 class GoogleHomeAlarmsSensor(GoogleHomeBaseEntity):
     """Google Home Alarms sensor."""
 
     _attr_icon = ICON_ALARMS
     _attr_device_class = SensorDeviceClass.TIMESTAMP
+    # Full list is bulky and changes often, keep only the summary in recorder
+    _unrecorded_attributes = frozenset({"alarms"})
 
     @property
     def label(self) -> str:
@@ -214,10 +292,15 @@ class GoogleHomeAlarmsSensor(GoogleHomeBaseEntity):
     @property
     def extra_state_attributes(self) -> AlarmsAttributes:
         """Return the state attributes."""
+        device = self.get_device()
+        next_alarm = device.get_next_alarm() if device else None
+        alarms = self._get_alarms_data()
         return {
             "next_alarm_status": self._get_next_alarm_status(),
+            "next_alarm_id": next_alarm.alarm_id if next_alarm else None,
+            "alarms_count": len(alarms),
             "alarm_volume": self._get_alarm_volume(),
-            "alarms": self._get_alarms_data(),
+            "alarms": alarms[: self.max_attribute_items() or None],
         }
 
     def _get_next_alarm_status(self) -> str:
@@ -276,6 +359,8 @@ class GoogleHomeTimersSensor(GoogleHomeBaseEntity):
 
     _attr_icons = ICON_TIMERS
     _attr_device_class = SensorDeviceClass.TIMESTAMP
+    # Full list is bulky and changes often, keep only the summary in recorder
+    _unrecorded_attributes = frozenset({"timers"})
 
     @property
     def label(self) -> str:
@@ -298,9 +383,14 @@ class GoogleHomeTimersSensor(GoogleHomeBaseEntity):
     @property
     def extra_state_attributes(self) -> TimersAttributes:
         """Return the state attributes."""
+        device = self.get_device()
+        next_timer = device.get_next_timer() if device else None
+        timers = self._get_timers_data()
         return {
             "next_timer_status": self._get_next_timer_status(),
-            "timers": self._get_timers_data(),
+            "next_timer_id": next_timer.timer_id if next_timer else None,
+            "timers_count": len(timers),
+            "timers": timers[: self.max_attribute_items() or None],
         }
 
     def _get_next_timer_status(self) -> str:
@@ -347,3 +437,379 @@ class GoogleHomeTimersSensor(GoogleHomeBaseEntity):
         if not call.data[SERVICE_ATTR_SKIP_REFRESH]:
             _LOGGER.debug("Refreshing Devices")
             await self.coordinator.async_request_refresh()
+
+
+class GoogleHomeNextAlarmSensor(GoogleHomeHouseEntity):
+    """Next alarm of all Google Home devices."""
+
+    _attr_icon = ICON_ALARMS
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def label(self) -> str:
+        """Label to use for name and unique id."""
+        return LABEL_NEXT_ALARM
+
+    @property
+    def state(self) -> str | None:
+        """Return next alarm of any device if available."""
+        next_alarm = self.client.item_index.alarms.first()
+        return next_alarm[1].local_time_iso if next_alarm else STATE_UNAVAILABLE
+
+    @property
+    def extra_state_attributes(self) -> NextAlarmAttributes:
+        """Return the state attributes."""
+        next_alarm = self.client.item_index.alarms.first()
+        if next_alarm is None:
+            return {
+                "device_id": None,
+                "device_name": None,
+                "alarm_id": None,
+                "status": GoogleHomeAlarmStatus.NONE.name.lower(),
+                "label": None,
+            }
+        device, alarm = next_alarm
+        return {
+            "device_id": device.device_id,
+            "device_name": device.name,
+            "alarm_id": alarm.alarm_id,
+            "status": alarm.status.name.lower(),
+            "label": alarm.label,
+        }
+
+
+class GoogleHomeNextTimerSensor(GoogleHomeHouseEntity):
+    """Next timer of all Google Home devices."""
+
+    _attr_icon = ICON_TIMERS
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def label(self) -> str:
+        """Label to use for name and unique id."""
+        return LABEL_NEXT_TIMER
+
+    @property
+    def state(self) -> str | None:
+        """Return next timer of any device if available."""
+        next_timer = self.client.item_index.timers.first()
+        return (
+            next_timer[1].local_time_iso
+            if next_timer and next_timer[1].local_time_iso
+            else STATE_UNAVAILABLE
+        )
+
+    @property
+    def extra_state_attributes(self) -> NextTimerAttributes:
+        """Return the state attributes."""
+        next_timer = self.client.item_index.timers.first()
+        if next_timer is None:
+            return {
+                "device_id": None,
+                "device_name": None,
+                "timer_id": None,
+                "status": GoogleHomeTimerStatus.NONE.name.lower(),
+                "label": None,
+                "duration": None,
+            }
+        device, timer = next_timer
+        return {
+            "device_id": device.device_id,
+            "device_name": device.name,
+            "timer_id": timer.timer_id,
+            "status": timer.status.name.lower(),
+            "label": timer.label,
+            "duration": timer.duration,
+        }
+
+
+class GoogleHomeActiveItemsSensor(GoogleHomeHouseEntity):
+    """Number of active alarms and timers of all Google Home devices."""
+
+    _attr_icon = ICON_RINGING
+
+    @property
+    def label(self) -> str:
+        """Label to use for name and unique id."""
+        return LABEL_ACTIVE_ITEMS
+
+    @property
+    def state(self) -> int:
+        """Return number of active alarms and timers."""
+        attributes = self.extra_state_attributes
+        return attributes["active_alarms"] + attributes["active_timers"]
+
+    @property
+    def extra_state_attributes(self) -> ActiveItemsAttributes:
+        """Return the state attributes."""
+        alarms = self.client.item_index.alarms
+        timers = self.client.item_index.timers
+        return {
+            "active_alarms": alarms.count(
+                GoogleHomeAlarmStatus.SET,
+                GoogleHomeAlarmStatus.RINGING,
+                GoogleHomeAlarmStatus.SNOOZED,
+            ),
+            "active_timers": timers.count(
+                GoogleHomeTimerStatus.SET,
+                GoogleHomeTimerStatus.PAUSED,
+                GoogleHomeTimerStatus.RINGING,
+            ),
+            "ringing_alarms": alarms.count(GoogleHomeAlarmStatus.RINGING),
+            "ringing_timers": timers.count(GoogleHomeTimerStatus.RINGING),
+        }
+
+
+class GoogleHomeItemEntities:
+    """Keep per alarm and per timer entities in sync with the devices.
+
+    Entities are added and removed from the alarms and timers deltas of the
+    devices updated since the last coordinator update. Devices seen for the
+    first time are compared with the entities created so far.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator[list[GoogleHomeDevice]],
+        client: GlocaltokensApiClient,
+        async_add_devices: AddEntitiesCallback,
+    ) -> None:
+        """Initialize the item entities tracker."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.client = client
+        self._async_add_devices = async_add_devices
+        self._entities: dict[tuple[str, str], GoogleHomeItemSensor] = {}
+        # Alarms and timers deltas of every device already applied
+        self._applied_deltas: dict[
+            str,
+            tuple[
+                GoogleHomeItemsDelta[GoogleHomeAlarm] | None,
+                GoogleHomeItemsDelta[GoogleHomeTimer] | None,
+            ],
+        ] = {}
+
+    def _is_enabled(self) -> bool:
+        """Return whether per item entities are enabled in options."""
+        entry = self.coordinator.config_entry
+        return entry is not None and bool(
+            entry.options.get(CONF_ITEM_ENTITIES, DEFAULT_ITEM_ENTITIES)
+        )
+
+    def _get_item_ids(self) -> dict[tuple[str, str], GoogleHomeDevice]:
+        """Return devices keyed by device and item IDs of their alarms and timers."""
+        if not self._is_enabled():
+            return {}
+        return {
+            (device.device_id, item_id): device
+            for device in self.coordinator.data
+            for item_id in device.get_alarm_ids() + device.get_timer_ids()
+        }
+
+    @callback
+    def async_remove_orphans(self, entry_id: str) -> None:
+        """Remove registered item entities of alarms and timers that no longer exist."""
+        registry = er.async_get(self.hass)
+        unique_ids = {
+            f"{device_id}/{item_id}" for device_id, item_id in self._get_item_ids()
+        }
+        for registry_entry in er.async_entries_for_config_entry(registry, entry_id):
+            if (
+                GoogleHomeItemSensor.is_item_unique_id(registry_entry.unique_id)
+                and registry_entry.unique_id not in unique_ids
+            ):
+                registry.async_remove(registry_entry.entity_id)
+
+    @callback
+    def async_update(self) -> None:
+        """Add entities for new items and remove entities of deleted items."""
+        if not self._is_enabled():
+            self._applied_deltas.clear()
+            self._remove_entities(list(self._entities))
+            return
+
+        new_entities: list[GoogleHomeItemSensor] = []
+        removed: list[tuple[str, str]] = []
+        device_ids: set[str] = set()
+        for device in self.coordinator.data:
+            device_ids.add(device.device_id)
+            deltas = (device.alarms_delta, device.timers_delta)
+            applied = self._applied_deltas.get(device.device_id)
+            if applied is not None and all(
+                delta is applied_delta
+                for delta, applied_delta in zip(deltas, applied, strict=True)
+            ):
+                # Alarms and timers of the device haven't been updated since
+                continue
+            self._applied_deltas[device.device_id] = deltas
+            alarms_delta, timers_delta = deltas
+            if applied is None or alarms_delta is None or timers_delta is None:
+                # Device seen for the first time, compare all of its items
+                item_ids = set(device.get_alarm_ids() + device.get_timer_ids())
+                removed.extend(
+                    key
+                    for key in self._entities
+                    if key[0] == device.device_id and key[1] not in item_ids
+                )
+            else:
+                item_ids = {alarm.alarm_id for alarm in alarms_delta.added} | {
+                    timer.timer_id for timer in timers_delta.added
+                }
+                removed.extend(
+                    (device.device_id, alarm.alarm_id) for alarm in alarms_delta.removed
+                )
+                removed.extend(
+                    (device.device_id, timer.timer_id) for timer in timers_delta.removed
+                )
+            new_entities.extend(
+                self._create_entity(device, item_id)
+                for item_id in item_ids
+                if (device.device_id, item_id) not in self._entities
+            )
+        for device_id in self._applied_deltas.keys() - device_ids:
+            # Device is gone
+            del self._applied_deltas[device_id]
+            removed.extend(key for key in self._entities if key[0] == device_id)
+
+        if new_entities:
+            self._async_add_devices(new_entities)
+        self._remove_entities(removed)
+
+    def _create_entity(
+        self, device: GoogleHomeDevice, item_id: str
+    ) -> GoogleHomeItemSensor:
+        """Create and track the entity of an alarm or timer."""
+        entity_class = (
+            GoogleHomeAlarmSensor
+            if item_id.startswith(f"{LABEL_ALARM}/")
+            else GoogleHomeTimerSensor
+        )
+        entity = entity_class(
+            self.coordinator,
+            self.client,
+            device.device_id,
+            device.name,
+            device.hardware,
+            item_id=item_id,
+        )
+        self._entities[device.device_id, item_id] = entity
+        return entity
+
+    @callback
+    def _remove_entities(self, keys: list[tuple[str, str]]) -> None:
+        """Remove entities of deleted alarms and timers."""
+        registry = er.async_get(self.hass)
+        for key in keys:
+            if (entity := self._entities.pop(key, None)) is None:
+                continue
+            if entity.registry_entry is not None:
+                registry.async_remove(entity.entity_id)
+            else:
+                self.hass.async_create_task(entity.async_remove(force_remove=True))
+
+
+class GoogleHomeItemSensor(GoogleHomeBaseEntity):
+    """Google Home sensor of a single alarm or timer."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[list[GoogleHomeDevice]],
+        client: GlocaltokensApiClient,
+        device_id: str,
+        device_name: str,
+        device_model: str | None,
+        *,
+        item_id: str,
+    ) -> None:
+        """Create Google Home item sensor."""
+        super().__init__(coordinator, client, device_id, device_name, device_model)
+        self.item_id = item_id
+        item = self.get_item()
+        self._item_label = item.label if item and item.label else item_id[-4:]
+        self._last_state: (
+            tuple[bool, GoogleHomeAlarmDict | GoogleHomeTimerDict | None] | None
+        ) = None
+
+    @staticmethod
+    def is_item_unique_id(unique_id: str) -> bool:
+        """Check if the unique id belongs to an alarm or timer sensor."""
+        parts = unique_id.split("/")
+        return len(parts) == 3 and parts[1] in (LABEL_ALARM, LABEL_TIMER)
+
+    @property
+    @abstractmethod
+    def item_type(self) -> str:
+        """Item type, alarm or timer."""
+
+    @property
+    def label(self) -> str:
+        """Label to use for name."""
+        return f"{self.item_type} {self._item_label}"
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID to use for this entity."""
+        return f"{self.device_id}/{self.item_id}"
+
+    @abstractmethod
+    def get_item(self) -> GoogleHomeAlarm | GoogleHomeTimer | None:
+        """Return the alarm or timer of this sensor."""
+
+    @property
+    def state(self) -> str | None:
+        """Return the time the item goes off."""
+        item = self.get_item()
+        return item.local_time_iso if item else None
+
+    @property
+    def extra_state_attributes(
+        self,
+    ) -> GoogleHomeAlarmDict | GoogleHomeTimerDict | None:
+        """Return the state attributes."""
+        item = self.get_item()
+        return item.as_dict() if item else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the item or availability has changed."""
+        item = self.get_item()
+        state = (self.available, item.as_dict() if item else None)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.async_write_ha_state()
+
+
+class GoogleHomeAlarmSensor(GoogleHomeItemSensor):
+    """Google Home sensor of a single alarm."""
+
+    _attr_icon = ICON_ALARM
+
+    @property
+    def item_type(self) -> str:
+        """Item type, alarm or timer."""
+        return LABEL_ALARM
+
+    def get_item(self) -> GoogleHomeAlarm | None:
+        """Return the alarm of this sensor."""
+        device = self.get_device()
+        return device.get_alarm(self.item_id) if device else None
+
+
+class GoogleHomeTimerSensor(GoogleHomeItemSensor):
+    """Google Home sensor of a single timer."""
+
+    _attr_icon = ICON_TIMER
+
+    @property
+    def item_type(self) -> str:
+        """Item type, alarm or timer."""
+        return LABEL_TIMER
+
+    def get_item(self) -> GoogleHomeTimer | None:
+        """Return the timer of this sensor."""
+        device = self.get_device()
+        return device.get_timer(self.item_id) if device else None
@@ -0,0 +1,143 @@
+"""Background renewal of Google Home cloud tokens."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ACCESS_TOKEN_LIFETIME,
+    DOMAIN,
+    LOCAL_AUTH_TOKEN_LIFETIME,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_REFRESH_MIN_INTERVAL,
+    TOKEN_REFRESH_RETRY,
+)
+from .exceptions import CloudRequestError, InvalidMasterToken
+
+if TYPE_CHECKING:
+    import asyncio
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .api import GlocaltokensApiClient
+    from .types import TokenRefreshStats
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class TokenRefresher:
+    """Renew cloud tokens shortly before they expire.
+
+    Google doesn't tell when tokens expire, so expiry is estimated from the
+    time they were received: about an hour for the access token and a day
+    for local auth tokens of devices. Renewing them ahead of time keeps
+    polling from running into expired tokens. A token rejected anyway is
+    still replaced by refreshing the devices on the next poll.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: GlocaltokensApiClient) -> None:
+        """Initialize the refresher."""
+        self.hass = hass
+        self._client = client
+        self._unsub: CALLBACK_TYPE | None = None
+        self._task: asyncio.Task[None] | None = None
+        # When devices were last refreshed because their tokens were due
+        self._devices_refreshed: float | None = None
+        self._next_refresh: datetime | None = None
+        self._last_refresh: datetime | None = None
+        self._last_error: str | None = None
+
+    def start(self) -> None:
+        """Start renewing tokens."""
+        if self._unsub is None and self._task is None:
+            self._schedule()
+
+    def stop(self) -> None:
+        """Stop renewing tokens."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._next_refresh = None
+
+    def _access_token_due(self) -> float | None:
+        """Return seconds until the access token should be renewed."""
+        age = self._client.token_ages()["access_token"]
+        if age is None:
+            return None
+        return ACCESS_TOKEN_LIFETIME - TOKEN_REFRESH_MARGIN - age
+
+    def _auth_tokens_due(self) -> float | None:
+        """Return seconds until the oldest local auth token should be renewed."""
+        age = self._client.token_ages()["local_auth_token"]
+        if age is None:
+            return None
+        due = LOCAL_AUTH_TOKEN_LIFETIME - TOKEN_REFRESH_MARGIN - age
+        if self._devices_refreshed is not None:
+            # Cloud may keep returning the same token, don't ask again right away
+            due = max(
+                due, self._devices_refreshed + TOKEN_REFRESH_RETRY - time.monotonic()
+            )
+        return due
+
+    def _schedule(self) -> None:
+        """Schedule the next renewal."""
+        dues = [
+            due
+            for due in (self._access_token_due(), self._auth_tokens_due())
+            if due is not None
+        ]
+        delay = max(min(dues, default=TOKEN_REFRESH_RETRY), TOKEN_REFRESH_MIN_INTERVAL)
+        self._next_refresh = dt_util.utcnow() + timedelta(seconds=delay)
+        self._unsub = async_call_later(self.hass, delay, self._refresh)
+        _LOGGER.debug("Tokens will be checked for renewal in %.0fs", delay)
+
+    @callback
+    def _refresh(self, _now: datetime) -> None:
+        """Renew due tokens in the background."""
+        self._unsub = None
+        self._task = self.hass.async_create_background_task(
+            self._async_refresh(), f"{DOMAIN} token refresh"
+        )
+
+    async def _async_refresh(self) -> None:
+        """Renew due tokens and schedule the next renewal."""
+        try:
+            access_token_due = self._access_token_due()
+            if access_token_due is not None and access_token_due <= 0:
+                _LOGGER.debug("Renewing access token before it expires")
+                await self._client.async_refresh_access_token()
+            auth_tokens_due = self._auth_tokens_due()
+            if auth_tokens_due is not None and auth_tokens_due <= 0:
+                _LOGGER.debug("Renewing local auth tokens before they expire")
+                await self._client.get_google_devices(force_refresh=True)
+                self._devices_refreshed = time.monotonic()
+            self._last_error = None
+        except (CloudRequestError, InvalidMasterToken) as err:
+            self._last_error = str(err) or type(err).__name__
+            _LOGGER.debug("Failed to renew tokens in the background: %r", err)
+        self._last_refresh = dt_util.utcnow()
+        self._task = None
+        self._schedule()
+
+    def stats(self) -> TokenRefreshStats:
+        """Return state of the background renewal."""
+        return {
+            "next_refresh": (
+                self._next_refresh.isoformat() if self._next_refresh else None
+            ),
+            "last_refresh": (
+                self._last_refresh.isoformat() if self._last_refresh else None
+            ),
+            "last_error": self._last_error,
+        }
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -52,6 +52,35 @@ class GoogleHomeTimerDict(TypedDict):
     label: str | None
 
 
+class DeviceInventoryDict(TypedDict):
+    """Typed dict for persisted representation of Google Home device."""
+
+    device_id: str
+    name: str
+    ip_address: str | None
+    ip_addresses: NotRequired[list[str]]
+    hardware: str | None
+    available: bool
+    do_not_disturb: bool
+    alarm_volume: int
+    alarms: list[AlarmJsonDict]
+    timers: list[TimerJsonDict]
+
+
+class CapabilityDict(TypedDict):
+    """Typed dict for learned support of an endpoint."""
+
+    supported: bool
+    checked: float
+
+
+class CapabilitiesDict(TypedDict):
+    """Typed dict for persisted endpoint support per hardware model and device."""
+
+    models: dict[str, dict[str, CapabilityDict]]
+    devices: dict[str, dict[str, CapabilityDict]]
+
+
 class DeviceAttributes(TypedDict):
     """Typed dict for device attributes."""
 
@@ -60,12 +89,15 @@ class DeviceAttributes(TypedDict):
     auth_token: str | None
     ip_address: str | None
     available: bool
+    stale: bool
 
 
 class AlarmsAttributes(TypedDict):
     """Typed dict for alarms attributes."""
 
     next_alarm_status: str
+    next_alarm_id: str | None
+    alarms_count: int
     alarm_volume: float
     alarms: list[GoogleHomeAlarmDict]
 
@@ -74,9 +106,189 @@ class TimersAttributes(TypedDict):
     """Typed dict for timers attributes."""
 
     next_timer_status: str
+    next_timer_id: str | None
+    timers_count: int
     timers: list[GoogleHomeTimerDict]
 
 
+class NextAlarmAttributes(TypedDict):
+    """Typed dict for attributes of the next alarm of all devices."""
+
+    device_id: str | None
+    device_name: str | None
+    alarm_id: str | None
+    status: str
+    label: str | None
+
+
+class NextTimerAttributes(TypedDict):
+    """Typed dict for attributes of the next timer of all devices."""
+
+    device_id: str | None
+    device_name: str | None
+    timer_id: str | None
+    status: str
+    label: str | None
+    duration: str | None
+
+
+class ActiveItemsAttributes(TypedDict):
+    """Typed dict for numbers of active alarms and timers of all devices."""
+
+    active_alarms: int
+    active_timers: int
+    ringing_alarms: int
+    ringing_timers: int
+
+
+class ItemsDeltaDict(TypedDict):
+    """Typed dict for IDs of alarms or timers changed by a poll."""
+
+    added: list[str]
+    removed: list[str]
+    changed: list[str]
+
+
+class PollSnapshotDict(TypedDict):
+    """Typed dict for snapshot of a single poll of a device."""
+
+    time: str
+    duration: float
+    available: bool
+    alarms: str
+    timers: str
+    alarms_delta: ItemsDeltaDict | None
+    timers_delta: ItemsDeltaDict | None
+
+
+class UpdateTimingsDict(TypedDict):
+    """Typed dict for duration of the steps of the last update in seconds."""
+
+    time: str
+    get_devices: float
+    collect_data: float
+    total: float
+    stale: int
+
+
+class TokenAgesDict(TypedDict):
+    """Typed dict for age of cached cloud tokens in seconds."""
+
+    access_token: float | None
+    homegraph: float | None
+    local_auth_token: float | None
+
+
+class TokenRefreshStats(TypedDict):
+    """Typed dict for state of the background token refresh."""
+
+    next_refresh: str | None
+    last_refresh: str | None
+    last_error: str | None
+
+
+class LoadStats(TypedDict):
+    """Typed dict for event loop lag in seconds and CPU use as a fraction."""
+
+    samples: int
+    lag_mean: float
+    lag_p99: float
+    lag_max: float
+    cpu_mean: float
+    cpu_p99: float
+    cpu_max: float
+
+
+class AllocationSiteDict(TypedDict):
+    """Typed dict for memory allocated by a line of code in bytes."""
+
+    site: str
+    size: int
+    size_diff: int
+    count: int
+    count_diff: int
+
+
+class LiveObjectsDict(TypedDict):
+    """Typed dict for number and shallow size in bytes of live objects."""
+
+    count: int
+    size: int
+
+
+class MemoryProfileDict(TypedDict):
+    """Typed dict for memory use of the integration over poll cycles."""
+
+    cycles: int
+    duration: float
+    traced_size: int
+    traced_peak: int
+    allocations: list[AllocationSiteDict]
+    objects: dict[str, LiveObjectsDict]
+    google_devices: int
+    coordinator_devices: int
+
+
+class QueueDelayStats(TypedDict):
+    """Typed dict for request queueing delay statistics in seconds."""
+
+    count: int
+    total: float
+    max: float
+    last: float
+
+
+class LatencyStats(TypedDict):
+    """Typed dict for request latency statistics of an endpoint in seconds."""
+
+    mean: float | None
+    deviation: float
+    last: float | None
+    samples: int
+    timeouts: int
+    timeout: float
+
+
+class CloudLimiterStats(TypedDict):
+    """Typed dict for state of the cloud call rate limiter."""
+
+    tokens: float
+    failures: int
+    backoff: float
+    allowed: int
+    limited: int
+    last_limited: str | None
+
+
+class ExecutorJobStats(TypedDict):
+    """Typed dict for timings of executor jobs in seconds."""
+
+    count: int
+    last_duration: float
+    max_duration: float
+    total_duration: float
+    max_wait: float
+    total_wait: float
+
+
+class ExecutorStats(TypedDict):
+    """Typed dict for cloud executor statistics."""
+
+    max_workers: int
+    pending: int
+    queue_depth: int
+    max_queue_depth: int
+    jobs: dict[str, ExecutorJobStats]
+
+
+class DiscoveryInfo(TypedDict):
+    """Typed dict for a cast device discovered with zeroconf."""
+
+    name: str
+    model: str
+    addresses: list[str]
+
+
 class ConfigFlowDict(TypedDict):
     """Typed dict for config flow handler."""
 
@@ -85,10 +297,29 @@ class ConfigFlowDict(TypedDict):
     master_token: str
 
 
+class DevicePollingDict(TypedDict, total=False):
+    """Typed dict for polling intervals of device endpoints in seconds."""
+
+    alarms: int
+    alarm_volume: int
+    do_not_disturb: int
+
+
 class OptionsFlowDict(TypedDict):
     """Typed dict for options flow handler."""
 
     update_interval: int
+    fast_start: bool
+    max_attribute_items: int
+    item_entities: bool
+    min_request_timeout: float
+    max_request_timeout: float
+    hedged_requests: bool
+    stagger_polling: bool
+    stream_updates: bool
+    measure_load: bool
+    device_polling: NotRequired[dict[str, DevicePollingDict]]
+    device: NotRequired[str]
 
 
 type JsonDict = Mapping[
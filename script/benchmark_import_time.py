@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Profile import time of the integration modules.
+
+Runs the import in a fresh interpreter with `-X importtime` and prints the
+slowest modules and whether heavy cloud dependencies were loaded.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.google_home"
+DEFAULT_MODULES = [PACKAGE, f"{PACKAGE}.sensor", f"{PACKAGE}.config_flow"]
+# Dependencies only needed when the Google cloud is contacted
+HEAVY_MODULES = [
+    "glocaltokens.client",
+    "gpsoauth",
+    "grpc",
+    "google.protobuf",
+    "requests",
+]
+
+
+def profile_import(module: str) -> dict[str, tuple[int, int]]:
+    """Import module in a new interpreter, return self and cumulative time in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main() -> int:
+    """Run main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to show")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        timings = profile_import(module)
+        total_us = sum(self_us for self_us, _ in timings.values())
+        own = {
+            name: timing for name, timing in timings.items() if name.startswith(PACKAGE)
+        }
+        print(f"{module}: {total_us / 1000:.1f} ms total, {len(timings)} modules")
+        print(f"  {'self [ms]':>10} {'cumulative [ms]':>16}  module")
+        slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_us, cumulative_us) in slowest[: args.top]:
+            print(f"  {self_us / 1000:>10.1f} {cumulative_us / 1000:>16.1f}  {name}")
+        print("  Integration modules:")
+        for name, (self_us, cumulative_us) in sorted(own.items()):
+            print(f"  {self_us / 1000:>10.1f} {cumulative_us / 1000:>16.1f}  {name}")
+        loaded = [name for name in HEAVY_MODULES if name in timings]
+        print(f"  Heavy cloud modules loaded: {', '.join(loaded) or 'none'}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
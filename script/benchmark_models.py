@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Microbenchmark the models and the alarms/timers sensor attributes.
+
+Payloads are synthetic, shaped like the JSON returned by a device and
+generated from a fixed seed, so results of different commits can be
+compared. Save a baseline with `--output` and pass it to `--compare`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import platform
+import random
+import sys
+import timeit
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+import uuid
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# pylint: disable=wrong-import-position
+from custom_components.google_home.models import (  # noqa: E402
+    GoogleHomeAlarm,
+    GoogleHomeAlarmStatus,
+    GoogleHomeDevice,
+    GoogleHomeTimer,
+    GoogleHomeTimerStatus,
+)
+from custom_components.google_home.sensor import (  # noqa: E402
+    GoogleHomeAlarmsSensor,
+    GoogleHomeTimersSensor,
+)
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from custom_components.google_home.api import GlocaltokensApiClient
+    from custom_components.google_home.types import AlarmJsonDict, TimerJsonDict
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+# Fixed reference point, fire times are spread over the following week
+BASE_TIME_MS = 1_767_225_600_000
+WEEK_MS = 7 * 24 * 60 * 60 * 1000
+LABELS = ["", "Wake up", "Gym", "Take out the trash", "Pizza"]
+
+
+def _item_id(rng: random.Random, prefix: str) -> str:
+    """Return an ID in the format used by devices, e.g. alarm/<uuid>."""
+    return f"{prefix}/{uuid.UUID(int=rng.getrandbits(128), version=4)}"
+
+
+def make_alarms(rng: random.Random, count: int) -> list[AlarmJsonDict]:
+    """Return alarms as sent by a device, including keys the integration drops."""
+    alarms: list[AlarmJsonDict] = []
+    for _ in range(count):
+        fire_time = BASE_TIME_MS + rng.randrange(WEEK_MS) // 60_000 * 60_000
+        fire_dt = dt_util.utc_from_timestamp(fire_time / 1000)
+        # Date and time patterns are not used by the integration
+        alarm = {
+            "date_pattern": {
+                "day": fire_dt.day,
+                "month": fire_dt.month,
+                "year": fire_dt.year,
+            },
+            "time_pattern": {
+                "hour": fire_dt.hour,
+                "minute": fire_dt.minute,
+                "second": 0,
+            },
+            "fire_time": fire_time,
+            "id": _item_id(rng, "alarm"),
+            "label": rng.choice(LABELS),
+            "recurrence": sorted(rng.sample(range(7), rng.randint(0, 7))),
+            "status": rng.choice(
+                [status.value for status in GoogleHomeAlarmStatus][1:]
+            ),
+        }
+        alarms.append(cast("AlarmJsonDict", alarm))
+    return alarms
+
+
+def make_timers(rng: random.Random, count: int) -> list[TimerJsonDict]:
+    """Return timers as sent by a device, a fifth of them paused."""
+    timers: list[TimerJsonDict] = []
+    for _ in range(count):
+        duration = rng.randrange(60, 4 * 60 * 60) * 1000
+        timer: dict[str, int | str] = {
+            "id": _item_id(rng, "timer"),
+            "label": rng.choice(LABELS),
+            "original_duration": duration,
+            "status": GoogleHomeTimerStatus.SET.value,
+        }
+        if rng.random() < 0.2:
+            timer["status"] = GoogleHomeTimerStatus.PAUSED.value
+            timer["remaining_duration"] = rng.randrange(duration)
+        else:
+            timer["fire_time"] = BASE_TIME_MS + rng.randrange(duration)
+        # Remaining duration of paused timers is not used by the integration
+        timers.append(cast("TimerJsonDict", timer))
+    return timers
+
+
+def make_device(
+    alarms: list[AlarmJsonDict], timers: list[TimerJsonDict]
+) -> GoogleHomeDevice:
+    """Return a device holding the given alarms and timers."""
+    device = GoogleHomeDevice(
+        device_id="benchmark", name="Kitchen", auth_token="token", ip_address="::1"
+    )
+    device.set_alarms(alarms)
+    device.set_timers(timers)
+    return device
+
+
+def make_sensor(
+    sensor_class: type[GoogleHomeAlarmsSensor | GoogleHomeTimersSensor],
+    device: GoogleHomeDevice,
+) -> GoogleHomeAlarmsSensor | GoogleHomeTimersSensor:
+    """Return a sensor bound to a stand-in coordinator holding the device."""
+    coordinator = cast(
+        "DataUpdateCoordinator[list[GoogleHomeDevice]]",
+        SimpleNamespace(data=[device], config_entry=None),
+    )
+    # Attribute benchmarks don't reach the client
+    client = cast("GlocaltokensApiClient", None)
+    return sensor_class(coordinator, client, device.device_id, device.name, None)
+
+
+def build_benchmarks(
+    alarms: list[AlarmJsonDict], timers: list[TimerJsonDict]
+) -> dict[str, Callable[[], object]]:
+    """Return benchmarks by name."""
+    device = make_device(alarms, timers)
+    alarm, timer = device.get_next_alarm(), device.get_next_timer()
+    assert alarm is not None
+    assert timer is not None
+    alarm_json, timer_json = alarms[0], timers[0]
+    alarms_sensor = make_sensor(GoogleHomeAlarmsSensor, device)
+    timers_sensor = make_sensor(GoogleHomeTimersSensor, device)
+
+    return {
+        "device.set_alarms_and_timers": lambda: device.set_alarms_and_timers(
+            alarms, timers
+        ),
+        "device.set_alarms": lambda: device.set_alarms(alarms),
+        "device.set_timers": lambda: device.set_timers(timers),
+        "device.get_sorted_alarms": device.get_sorted_alarms,
+        "device.get_next_alarm": device.get_next_alarm,
+        "device.get_sorted_timers": device.get_sorted_timers,
+        "device.get_next_timer": device.get_next_timer,
+        "alarm.__init__": lambda: GoogleHomeAlarm(
+            alarm_id=alarm_json["id"],
+            fire_time=alarm_json["fire_time"],
+            status=alarm_json["status"],
+            label=alarm_json.get("label"),
+            recurrence=alarm_json.get("recurrence"),
+        ),
+        "alarm.as_dict": alarm.as_dict,
+        "timer.__init__": lambda: GoogleHomeTimer(
+            timer_id=timer_json["id"],
+            fire_time=timer_json.get("fire_time"),
+            duration=timer_json["original_duration"],
+            status=timer_json["status"],
+            label=timer_json.get("label"),
+        ),
+        "timer.as_dict": timer.as_dict,
+        "alarms_sensor.extra_state_attributes": lambda: (
+            alarms_sensor.extra_state_attributes
+        ),
+        "timers_sensor.extra_state_attributes": lambda: (
+            timers_sensor.extra_state_attributes
+        ),
+    }
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """Return the best time of a single call in seconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> int:
+    """Run main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "benchmarks", nargs="*", help="Names of benchmarks to run, default all"
+    )
+    parser.add_argument("--alarms", type=int, default=200, help="Alarms per device")
+    parser.add_argument("--timers", type=int, default=200, help="Timers per device")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the fixtures")
+    parser.add_argument(
+        "--time-zone", default="Europe/London", help="Local time zone of models"
+    )
+    parser.add_argument("--output", type=Path, help="Save results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare with")
+    args = parser.parse_args()
+
+    time_zone = dt_util.get_time_zone(args.time_zone)
+    if time_zone is None:
+        parser.error(f"Unknown time zone {args.time_zone}")
+    dt_util.set_default_time_zone(time_zone)
+
+    rng = random.Random(args.seed)
+    alarms = make_alarms(rng, args.alarms)
+    timers = make_timers(rng, args.timers)
+    benchmarks = build_benchmarks(alarms, timers)
+    if unknown := set(args.benchmarks) - set(benchmarks):
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    baseline: dict[str, float] = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+
+    print(
+        f"Python {platform.python_version()}, {args.alarms} alarms, "
+        f"{args.timers} timers, seed {args.seed}, best of {args.repeat}"
+    )
+    print(f"  {'time [us]':>12} {'change':>8}  benchmark")
+    results: dict[str, float] = {}
+    for name, func in benchmarks.items():
+        if args.benchmarks and name not in args.benchmarks:
+            continue
+        results[name] = measure(func, args.repeat)
+        change = ""
+        if name in baseline:
+            change = f"{(results[name] / baseline[name] - 1) * 100:+.1f}%"
+        print(f"  {results[name] * 1e6:>12.2f} {change:>8}  {name}")
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "alarms": args.alarms,
+                    "timers": args.timers,
+                    "seed": args.seed,
+                    "time_zone": args.time_zone,
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())